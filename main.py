@@ -3,10 +3,12 @@ TWOM Boss Timer Plugin for AstrBot
 Tracks boss respawn times and sends automatic reminders
 """
 
+import asyncio
 import re
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 import zhconv
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -22,6 +24,28 @@ from astrbot.core.utils.astrbot_path import get_astrbot_data_path
 # Import utils modules
 from .utils import boss_config, formatter, lib_mini, map_config, permission, scheduler, time_utils, timer_storage
 
+# Debounced timers.json save: bursts of updates share a single write.
+_TIMERS_FLUSH_JOB_ID = "timers_flush"
+_TIMERS_FLUSH_DELAY_SECONDS = 3
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
+_LIST_SHORTCUTS = frozenset({"bl", "hz", "汇总", "匯總"})
+_LIST_SHORTCUT_LEN = 2
+
+# /map arguments that show the map list instead of a map (lowercase)
+_MAP_LIST_KEYWORDS = frozenset({"list", "ls", "列表", "地图", "help", "帮助"})
+
+# Avoid matching common English phrases like "is day", "world", etc.
+_COMMON_WORDS = frozenset(
+    {"is", "was", "has", "had", "world", "good", "bad", "old", "new", "should", "would", "could"}
+)
+
+
+def _to_simplified(text: str) -> str:
+    """Convert Traditional Chinese to Simplified (pure ASCII is returned as-is)"""
+    return text if text.isascii() else zhconv.convert(text, 'zh-cn')
+
 
 @register(
     "astrbot_plugin_twom_boss_timer",
@@ -59,11 +83,36 @@ class BossTimer(Star):
         default_bosses_path = Path(__file__).parent / "default_bosses.json"
         self.bosses = boss_config.load_bosses(default_bosses_path)
         self.boss_alias_map = boss_config.build_alias_map(self.bosses)
-
-        self.timers = timer_storage.load_timers(self.data_dir)
+        self._alias_first_chars = boss_config.build_alias_first_chars(self.boss_alias_map)
+        self._death_tokens = boss_config.build_death_token_map(self.boss_alias_map)
+        # Boss and map lists are static, so render their text once
+        self._boss_list_entries = self._render_boss_list_entries()
+
+        # Config is fixed for the plugin instance's lifetime (AstrBot reloads the
+        # plugin on config change), so parse the reminder intervals once.
+        self._reminder_intervals = scheduler.get_reminder_intervals(self.config)
+        # group_id -> allowed boss names (None = no filter), filled on first use
+        self._allowed_bosses_cache: Dict[str, Optional[FrozenSet[str]]] = {}
+
+        self.timers = timer_storage.load_timers(self.data_dir, self.timezone)
+        # Pending persistence: changed timer IDs go to the journal, while bulk
+        # changes (reset, expiry cleanup) request a full snapshot instead.
+        self._dirty_timer_ids: Set[str] = set()
+        self._timers_snapshot_needed = False
+        # Serializes off-loop writes so journal appends land in order
+        self._flush_lock = asyncio.Lock()
+        # timer_id -> reminder job IDs, so cancelling skips scanning every job
+        self._timer_jobs: Dict[str, List[str]] = {}
+        # scope_key -> boss_name -> timer IDs, so per-chat lookups skip full scans
+        self._by_scope: Dict[str, Dict[str, Set[str]]] = defaultdict(dict)
+        # scope_key -> (rendered /boss list message, valid until); cleared on any
+        # timer change, and an entry expires when its earliest timer spawns
+        self._list_cache: Dict[str, Tuple[str, Optional[datetime]]] = {}
 
         self.maps = map_config.load_maps(self.assets_dir)
         self.map_alias_map = map_config.build_map_alias_map(self.maps)
+        self._map_paths = map_config.resolve_map_files(self.maps, self.assets_dir)
+        self._map_list_message = self._render_map_list()
         self.lib_mini_last_death_report_time = None
         # Real message origin captured from the Lib Mini group, used to deliver
         # scheduled reminders (a fabricated origin string is not deliverable).
@@ -76,10 +125,72 @@ class BossTimer(Star):
 
         logger.info("TWOM Boss Timer plugin initialized successfully")
 
+    def _render_boss_list_entries(self) -> List[Tuple[str, str]]:
+        """Build (node name, node text) for each boss in /boss bosses, sorted by display name"""
+        sorted_bosses = sorted(
+            self.bosses.items(),
+            key=lambda x: x[1].get("display_name", x[0])
+        )
+
+        entries = []
+        for boss_key, boss_data in sorted_bosses:
+            display_name = boss_data.get("display_name", boss_key)
+            aliases = boss_data.get("aliases", [])
+            emoji = boss_data.get("emoji", "")
+
+            # Format respawn time
+            hours = boss_data.get("respawn_hours", 0)
+            minutes = boss_data.get("respawn_minutes", 0)
+            seconds = boss_data.get("respawn_seconds", 0)
+            respawn_parts = []
+            if hours > 0:
+                respawn_parts.append(f"{hours}h")
+            if minutes > 0:
+                respawn_parts.append(f"{minutes}m")
+            if seconds > 0:
+                respawn_parts.append(f"{seconds}s")
+            respawn_str = " ".join(respawn_parts) if respawn_parts else "未知"
+
+            # Format aliases (limit to 5 for readability)
+            alias_display = aliases[:5] if len(aliases) > 5 else aliases
+            alias_str = " / ".join(alias_display)
+            if len(aliases) > 5:
+                alias_str += f" (+{len(aliases) - 5})"
+
+            # Node content with cleaner format and spacing
+            content_text = (
+                f"{emoji} {display_name}\n"
+                f"\n"
+                f"⏱  刷新: {respawn_str}\n"
+                f"\n"
+                f"📝  别名: {alias_str}"
+            )
+            entries.append((f"{emoji} {display_name}", content_text))
+        return entries
+
+    def _render_map_list(self) -> str:
+        """Build the /map list message"""
+        maps_by_category = map_config.get_maps_by_category(self.maps)
+
+        lines = ["🗺️ 可用地图列表：\n"]
+        for category, map_list in sorted(maps_by_category.items()):
+            lines.append(f"【{category}】")
+            for map_data in map_list:
+                map_id = map_data.get("id")
+                name = map_data.get("name")
+                aliases = map_data.get("aliases", [])
+                alias_str = "、".join(aliases[:2]) if aliases else ""
+                lines.append(f"  {map_id}. {name} ({alias_str})")
+            lines.append("")
+
+        lines.append("使用方法：/map <地图名或别名>")
+        lines.append("例如：/map 森林 或 /map 1")
+        return "\n".join(lines)
+
     @staticmethod
     def _get_user_id(unified_msg_origin: str) -> str:
         """Extract user ID from unified_msg_origin"""
-        return unified_msg_origin.split("_")[-1] if "_" in unified_msg_origin else unified_msg_origin
+        return unified_msg_origin.rpartition("_")[2] or unified_msg_origin
 
     def _is_boss_timer_enabled_for_event(self, event: AstrMessageEvent) -> bool:
         """Check whether this event is allowed to use boss timer features."""
@@ -96,41 +207,134 @@ class BossTimer(Star):
             logger.debug(f"User {user_id} not enabled for boss timer in private chat")
         return enabled
 
+    def _get_allowed_bosses(self, group_id: str) -> Optional[FrozenSet[str]]:
+        """Cached permission.get_allowed_bosses_for_group for this plugin's config"""
+        try:
+            return self._allowed_bosses_cache[group_id]
+        except KeyError:
+            pass
+        allowed = permission.get_allowed_bosses_for_group(group_id, self.config)
+        self._allowed_bosses_cache[group_id] = allowed
+        return allowed
+
+    @staticmethod
+    def _scope_key(group_id: Optional[str], user_id: Optional[str]) -> str:
+        """Build the index scope key for a group or private chat"""
+        return f"g:{group_id}" if group_id else f"u:{user_id}"
+
+    @staticmethod
+    def _make_timer_id(group_id: Optional[str], user_id: Optional[str], boss_name: str) -> str:
+        """Build a timer ID without timestamp (so a new record for the same boss overwrites)"""
+        if group_id:
+            return f"{group_id}_{boss_name}"
+        return f"private_{user_id}_{boss_name}"
+
+    def _index_timer(self, timer_id: str, timer_data: Dict):
+        """Add a timer to the scope index"""
+        scope_key = self._scope_key(timer_data.get("group_id"), timer_data.get("user_id"))
+        self._by_scope[scope_key].setdefault(timer_data.get("boss"), set()).add(timer_id)
+
+    def _unindex_timer(self, timer_id: str, timer_data: Dict):
+        """Remove a timer from the scope index"""
+        scope_key = self._scope_key(timer_data.get("group_id"), timer_data.get("user_id"))
+        scope_timers = self._by_scope.get(scope_key)
+        if scope_timers is None:
+            return
+        boss_name = timer_data.get("boss")
+        timer_ids = scope_timers.get(boss_name)
+        if timer_ids is not None:
+            timer_ids.discard(timer_id)
+            if not timer_ids:
+                del scope_timers[boss_name]
+                if not scope_timers:
+                    del self._by_scope[scope_key]
+
     def _restore_timers(self):
         """Restore scheduled jobs from saved timers"""
-        removed = scheduler.cleanup_expired_timers(self.timers, self.timezone)
+        now = datetime.now(self.timezone)
+        removed = scheduler.cleanup_expired_timers(self.timers, self.timezone, now)
         if removed > 0:
-            timer_storage.save_timers(self.data_dir, self.timers)
+            self._mark_timers_dirty()
 
-        intervals = scheduler.get_reminder_intervals(self.config)
+        # Timers were validated by load_timers, so no per-timer error handling.
+        # One batch for all timers, so the scheduler wakes up once, not per job.
+        self._by_scope.clear()
         restored = 0
-
-        for timer_id, timer_data in self.timers.items():
-            if not (spawn_time_str := timer_data.get("spawn_time")):
-                continue
-
-            try:
-                spawn_time = datetime.fromisoformat(spawn_time_str).replace(tzinfo=self.timezone)
+        with scheduler.batched_jobs(self.scheduler):
+            for timer_id, timer_data in self.timers.items():
+                self._index_timer(timer_id, timer_data)
                 if scheduler.schedule_reminders(
                     self.scheduler,
                     timer_id,
-                    timer_data.get("boss"),
-                    spawn_time,
+                    boss_config.get_boss_display_name(timer_data.get("boss"), self.bosses),
+                    timer_storage.get_spawn_time(timer_data, self.timezone),
                     timer_data.get("umo"),
                     self._send_reminder,
-                    intervals,
+                    self._reminder_intervals,
                     self.timezone,
+                    now,
+                    self._timer_jobs,
                 ) > 0:
                     restored += 1
-            except Exception as e:
-                logger.error(f"Failed to restore timer {timer_id}: {e}")
 
         if restored > 0:
             logger.info(f"Restored {restored} active timers")
 
-    async def _send_reminder(self, boss_name: str, spawn_time: datetime, umo: str, minutes_before: int):
-        """Send reminder message (scheduled callback)"""
-        display_name = boss_config.get_boss_display_name(boss_name, self.bosses)
+    def _mark_timers_dirty(self, *timer_ids: str):
+        """
+        Schedule a debounced save of the given timers (no-op if one is pending).
+
+        With no timer IDs, the next save writes a full snapshot. Every timer
+        change goes through here, so it also drops cached /boss list output.
+        """
+        self._list_cache.clear()
+        if timer_ids:
+            self._dirty_timer_ids.update(timer_ids)
+        else:
+            self._timers_snapshot_needed = True
+        if self.scheduler.get_job(_TIMERS_FLUSH_JOB_ID):
+            return
+        self.scheduler.add_job(
+            self._flush_timers_job,
+            "date",
+            run_date=datetime.now(self.timezone) + timedelta(seconds=_TIMERS_FLUSH_DELAY_SECONDS),
+            id=_TIMERS_FLUSH_JOB_ID,
+            misfire_grace_time=None,
+        )
+
+    def _take_timer_changes(self) -> Tuple[Dict, Set[str], bool]:
+        """
+        Detach unsaved changes for writing.
+
+        Returns a shallow copy of the timers (timer dicts are replaced, not
+        edited, on change), the dirty timer IDs, and whether a full snapshot
+        is needed, so the write can run off the event loop.
+        """
+        changes = (dict(self.timers), self._dirty_timer_ids, self._timers_snapshot_needed)
+        self._dirty_timer_ids = set()
+        self._timers_snapshot_needed = False
+        return changes
+
+    def _write_timer_changes(self, timers: Dict, dirty_timer_ids: Set[str], snapshot_needed: bool):
+        """Persist detached changes (journal append or full snapshot)"""
+        if snapshot_needed:
+            timer_storage.save_timers(self.data_dir, timers)
+        elif dirty_timer_ids:
+            timer_storage.append_timer_changes(self.data_dir, timers, dirty_timer_ids)
+
+    def _flush_timers(self):
+        """Persist unsaved timer changes on the calling thread"""
+        if self._timers_snapshot_needed or self._dirty_timer_ids:
+            self._write_timer_changes(*self._take_timer_changes())
+
+    async def _flush_timers_job(self):
+        """Debounced save (scheduled callback); file I/O runs in a worker thread"""
+        async with self._flush_lock:
+            if self._timers_snapshot_needed or self._dirty_timer_ids:
+                await asyncio.to_thread(self._write_timer_changes, *self._take_timer_changes())
+
+    async def _send_reminder(self, display_name: str, spawn_time: datetime, umo: str, minutes_before: int):
+        """Send reminder message (scheduled callback; display name resolved at scheduling)"""
         message = formatter.format_reminder_message(
             display_name,
             spawn_time,
@@ -139,7 +343,7 @@ class BossTimer(Star):
             self.show_secondary,
         )
 
-        logger.info(f"Sending reminder: {boss_name} {minutes_before}min to {umo}")
+        logger.info(f"Sending reminder: {display_name} {minutes_before}min to {umo}")
 
         try:
             await self.context.send_message(umo, MessageEventResult().message(message))
@@ -217,13 +421,9 @@ class BossTimer(Star):
             logger.error(f"Failed to send Lib Mini reminder to {target}: {e}")
 
     @filter.event_message_type(filter.EventMessageType.ALL, priority=100)
-    async def handle_boss_death(self, event: AstrMessageEvent):
-        """Handle boss death recording. Pattern: <boss_name> d [time]"""
+    async def handle_all_messages(self, event: AstrMessageEvent):
+        """Single entry point for plain messages: list shortcuts and death reports"""
         msg = event.get_message_str().strip()
-        # Convert Traditional Chinese to Simplified Chinese
-        msg = zhconv.convert(msg, 'zh-cn')
-        # Normalize spaces (replace full-width spaces and multiple spaces with single space)
-        msg = re.sub(r'\s+', ' ', msg.replace('　', ' '))
         group_id = event.get_group_id()
 
         # Capture a real, deliverable message origin for the Lib Mini group so
@@ -231,6 +431,32 @@ class BossTimer(Star):
         if group_id and str(group_id) == self._get_lib_mini_reminder_group_id():
             self.lib_mini_group_umo = event.unified_msg_origin
 
+        # Shortcut commands like 'bl', 'hz' for quick access (all two characters,
+        # so other messages skip the conversion)
+        if len(msg) == _LIST_SHORTCUT_LEN and _to_simplified(msg).lower() in _LIST_SHORTCUTS:
+            async for result in self.list_timers(event):
+                yield result
+            return
+
+        async for result in self._handle_boss_death(event, msg):
+            yield result
+
+    async def _handle_boss_death(self, event: AstrMessageEvent, msg: str):
+        """Handle boss death recording. Pattern: <boss_name> d [time]"""
+        group_id = event.get_group_id()
+
+        # Slash commands are never death reports, and every death report carries
+        # the "d" keyword; skip everything else before conversion and parsing.
+        if not msg or msg[0] == "/":
+            return
+        if "d" not in msg and "D" not in msg:
+            return
+
+        # Convert Traditional Chinese to Simplified Chinese. No whitespace
+        # normalization is needed: the parsers below split on any whitespace,
+        # including full-width spaces, and lib_mini normalizes on its own.
+        msg = _to_simplified(msg)
+
         if (
             group_id
             and str(group_id) == self._get_lib_mini_reminder_group_id()
@@ -243,7 +469,9 @@ class BossTimer(Star):
 
         # Parse boss command (支持 "大树 d" 和 "大树d" 两种格式)
         # 按最长 boss 名称优先匹配，避免把 "red bee" 误判成 "red"。
-        parsed = boss_config.parse_boss_death_command(msg, self.boss_alias_map)
+        parsed = boss_config.parse_boss_death_command(
+            msg, self.boss_alias_map, self._alias_first_chars, self._death_tokens
+        )
         if parsed is None:
             logger.debug(f"Boss death pattern not matched: '{msg}'")
             return
@@ -258,16 +486,14 @@ class BossTimer(Star):
             if not has_space_before_d:
                 return
 
-            # Avoid matching common English phrases like "is day", "world", etc.
-            common_words = {"is", "was", "has", "had", "world", "good", "bad", "old", "new", "should", "would", "could"}
-
-            # Check if input contains Chinese characters (allow single Chinese chars)
-            has_chinese = any('\u4e00' <= char <= '\u9fff' for char in boss_input)
+            # Check if input contains Chinese characters (allow single Chinese chars);
+            # pure-ASCII input can't, so skip the scan for the common case
+            has_chinese = not boss_input.isascii() and _CJK_RE.search(boss_input) is not None
 
             # Only show message if:
             # 1. Has Chinese character OR input is at least 2 characters (avoid single English letters)
             # 2. Not a common English word that might appear in phrases
-            if (has_chinese or len(boss_input) >= 2) and boss_input not in common_words:
+            if (has_chinese or len(boss_input) >= 2) and boss_input not in _COMMON_WORDS:
                 yield MessageEventResult().message(
                     f"❌ 我还不知道什么是 {boss_input} 呢\n\n"
                     f"请输入 /boss bosses 来查看所有支持的boss名称"
@@ -275,8 +501,9 @@ class BossTimer(Star):
                 event.stop_event()
             return
 
+        now = datetime.now(self.timezone)
         try:
-            death_time = time_utils.parse_death_time(time_part or "", self.timezone)
+            death_time = time_utils.parse_death_time(time_part or "", self.timezone, now)
         except ValueError as e:
             logger.debug(f"Failed to parse death time for '{msg}': {e}")
             return
@@ -287,56 +514,52 @@ class BossTimer(Star):
 
         # Check group boss filter
         if group_id:
-            allowed_bosses = permission.get_allowed_bosses_for_group(group_id, self.config)
-            if allowed_bosses and boss_name not in allowed_bosses:
+            allowed_bosses = self._get_allowed_bosses(group_id)
+            if allowed_bosses is not None and boss_name not in allowed_bosses:
                 logger.debug(f"Boss {boss_name} not allowed in group {group_id}. Allowed: {allowed_bosses}")
                 return
 
         # Calculate spawn time and create timer
         spawn_time = boss_config.calculate_spawn_time(boss_name, death_time, self.bosses)
 
-        # Create timer_id without timestamp (so same boss overwrites)
-        if group_id:
-            timer_id = f"{group_id}_{boss_name}"
-            user_id = None
-        else:
-            user_id = self._get_user_id(event.unified_msg_origin)
-            timer_id = f"private_{user_id}_{boss_name}"
+        user_id = None if group_id else self._get_user_id(event.unified_msg_origin)
+        timer_id = self._make_timer_id(group_id, user_id, boss_name)
 
         # Remove old timer and scheduled jobs if exists
         if timer_id in self.timers:
-            # Cancel all scheduled reminder jobs for this timer
-            for job in self.scheduler.get_jobs():
-                if job.id.startswith(f"reminder_{timer_id}_"):
-                    job.remove()
+            scheduler.cancel_reminder_jobs(self.scheduler, timer_id, self._timer_jobs)
+            self._unindex_timer(timer_id, self.timers[timer_id])
 
         # Save timer
         self.timers[timer_id] = {
             "boss": boss_name,
             "death_time": death_time.isoformat(),
             "spawn_time": spawn_time.isoformat(),
+            "_spawn_dt": spawn_time,
             "umo": event.unified_msg_origin,
             "group_id": group_id,
             "user_id": user_id,
-            "created_at": datetime.now(self.timezone).isoformat(),
+            "created_at": now.isoformat(),
         }
-        timer_storage.save_timers(self.data_dir, self.timers)
+        self._index_timer(timer_id, self.timers[timer_id])
+        self._mark_timers_dirty(timer_id)
 
         # Schedule reminders
-        intervals = scheduler.get_reminder_intervals(self.config)
+        display_name = boss_config.get_boss_display_name(boss_name, self.bosses)
         scheduler.schedule_reminders(
             self.scheduler,
             timer_id,
-            boss_name,
+            display_name,
             spawn_time,
             event.unified_msg_origin,
             self._send_reminder,
-            intervals,
+            self._reminder_intervals,
             self.timezone,
+            now,
+            self._timer_jobs,
         )
 
         # Send confirmation
-        display_name = boss_config.get_boss_display_name(boss_name, self.bosses)
         message = formatter.format_boss_spawn_message(
             display_name,
             spawn_time,
@@ -346,20 +569,6 @@ class BossTimer(Star):
 
         yield MessageEventResult().message(message)
 
-    @filter.event_message_type(filter.EventMessageType.ALL, priority=100)
-    async def handle_shortcut_commands(self, event: AstrMessageEvent):
-        """Handle shortcut commands like 'bl', 'hz' for quick access"""
-        msg = event.get_message_str().strip()
-        msg = zhconv.convert(msg, 'zh-cn')
-        msg = msg.lower()
-
-        # Check if it's a list shortcut
-        if msg in ["bl", "hz", "汇总", "匯總"]:
-            # Call the list timers logic
-            async for result in self.list_timers(event):
-                yield result
-            return
-
     @filter.command_group("boss")
     def boss_command_group(self):
         """Boss timer command group"""
@@ -374,45 +583,55 @@ class BossTimer(Star):
         group_id = event.get_group_id()
 
         viewer_user_id = None if group_id else self._get_user_id(event.unified_msg_origin)
+        scope_key = self._scope_key(group_id, viewer_user_id)
 
-        # Collect visible timers
-        visible_timers = {}
-        for timer_id, timer_data in self.timers.items():
-            spawn_time_str = timer_data.get("spawn_time")
-            if not spawn_time_str:
-                continue
+        cached = self._list_cache.get(scope_key)
+        if cached is not None and (cached[1] is None or now < cached[1]):
+            yield MessageEventResult().message(cached[0])
+            return
+
+        allowed_bosses = self._get_allowed_bosses(group_id) if group_id else None
+
+        # Everyone sees their own chat's timers, which the scope index yields
+        # directly; core groups also see every other group's timers in their set.
+        if group_id and permission.is_core_group(group_id, self.config):
+            viewer_set = permission.get_group_set(group_id, self.config)
+            visible_scopes = [
+                scope_timers
+                for key, scope_timers in self._by_scope.items()
+                if key.startswith("g:")
+                and permission.get_group_set(key[2:], self.config) == viewer_set
+            ]
+        else:
+            visible_scopes = [self._by_scope.get(scope_key, {})]
+        candidates = [
+            timer_id
+            for scope_timers in visible_scopes
+            for timer_ids in scope_timers.values()
+            for timer_id in timer_ids
+        ]
 
-            try:
-                spawn_time = datetime.fromisoformat(spawn_time_str).replace(tzinfo=self.timezone)
-                if spawn_time <= now:
-                    continue  # Skip expired
+        # Collect visible timers. Timers are validated on load and built with a
+        # parsed spawn time on insert, so no per-timer error handling is needed.
+        visible_timers = {}
+        for timer_id in candidates:
+            timer_data = self.timers[timer_id]
+            if timer_storage.get_spawn_time(timer_data, self.timezone) <= now:
+                continue  # Skip expired
 
-                # Check if timer should be visible
-                if not permission.should_show_timer(
-                    timer_id,
-                    timer_data,
-                    group_id,
-                    viewer_user_id,
-                    self.config,
-                ):
-                    continue
-
-                # Check group boss filter
-                if group_id:
-                    boss_name = timer_data.get("boss")
-                    allowed_bosses = permission.get_allowed_bosses_for_group(group_id, self.config)
-                    if allowed_bosses is not None and boss_name not in allowed_bosses:
-                        continue
-
-                visible_timers[timer_id] = timer_data
-            except Exception:
+            # Check group boss filter
+            if allowed_bosses is not None and timer_data.get("boss") not in allowed_bosses:
                 continue
 
+            visible_timers[timer_id] = timer_data
+
         if not visible_timers:
-            yield MessageEventResult().message("⏳ 当前没有活跃的boss计时器")
+            message = "⏳ 当前没有活跃的boss计时器"
+            self._list_cache[scope_key] = (message, None)
+            yield MessageEventResult().message(message)
             return
 
-        # Format and send
+        # Format and send; the output changes once the earliest timer expires
         message = formatter.format_timer_list(
             visible_timers,
             self.bosses,
@@ -420,6 +639,11 @@ class BossTimer(Star):
             self.secondary_tz,
             self.show_secondary,
         )
+        valid_until = min(
+            timer_storage.get_spawn_time(timer_data, self.timezone)
+            for timer_data in visible_timers.values()
+        )
+        self._list_cache[scope_key] = (message, valid_until)
         yield MessageEventResult().message(message)
 
     @boss_command_group.command("bosses", alias={"all", "可用", "支持", "名单"})
@@ -432,54 +656,12 @@ class BossTimer(Star):
             yield MessageEventResult().message("❌ 没有加载任何boss配置")
             return
 
-        # Sort bosses by display name
-        sorted_bosses = sorted(
-            self.bosses.items(),
-            key=lambda x: x[1].get("display_name", x[0])
-        )
-
         # Create nodes for forward message
-        nodes = []
-        bot_id = event.get_self_id() or "0"
-
-        for boss_key, boss_data in sorted_bosses:
-            display_name = boss_data.get("display_name", boss_key)
-            aliases = boss_data.get("aliases", [])
-            emoji = boss_data.get("emoji", "")
-
-            # Format respawn time
-            hours = boss_data.get("respawn_hours", 0)
-            minutes = boss_data.get("respawn_minutes", 0)
-            seconds = boss_data.get("respawn_seconds", 0)
-            respawn_parts = []
-            if hours > 0:
-                respawn_parts.append(f"{hours}h")
-            if minutes > 0:
-                respawn_parts.append(f"{minutes}m")
-            if seconds > 0:
-                respawn_parts.append(f"{seconds}s")
-            respawn_str = " ".join(respawn_parts) if respawn_parts else "未知"
-
-            # Format aliases (limit to 5 for readability)
-            alias_display = aliases[:5] if len(aliases) > 5 else aliases
-            alias_str = " / ".join(alias_display)
-            if len(aliases) > 5:
-                alias_str += f" (+{len(aliases) - 5})"
-
-            # Create node content with cleaner format and spacing
-            content_text = (
-                f"{emoji} {display_name}\n"
-                f"\n"
-                f"⏱  刷新: {respawn_str}\n"
-                f"\n"
-                f"📝  别名: {alias_str}"
-            )
-            node = Node(
-                content=[Plain(content_text)],
-                uin=str(bot_id),
-                name=f"{emoji} {display_name}"
-            )
-            nodes.append(node)
+        bot_id = str(event.get_self_id() or "0")
+        nodes = [
+            Node(content=[Plain(content_text)], uin=bot_id, name=name)
+            for name, content_text in self._boss_list_entries
+        ]
 
         # Add usage hint as the last node
         usage_node = Node(
@@ -490,7 +672,7 @@ class BossTimer(Star):
                 "\n"
                 "例如:  wdk d  /  大树 d"
             )],
-            uin=str(bot_id),
+            uin=bot_id,
             name="📖 使用说明"
         )
         nodes.append(usage_node)
@@ -506,10 +688,8 @@ class BossTimer(Star):
         if not self._is_boss_timer_enabled_for_event(event):
             return
 
-        boss_input_lower = zhconv.convert(boss_input, 'zh-cn').lower()
-
-        # Resolve boss name
-        boss_name = boss_config.get_boss_by_alias(boss_input_lower, self.boss_alias_map)
+        # Resolve boss name (lookup is case-insensitive)
+        boss_name = boss_config.get_boss_by_alias(_to_simplified(boss_input), self.boss_alias_map)
         if not boss_name:
             yield MessageEventResult().message(
                 f"❌ 未找到boss：{boss_input}\n使用 /boss bosses 查看所有支持的boss"
@@ -519,27 +699,20 @@ class BossTimer(Star):
         group_id = event.get_group_id()
         current_user_id = None if group_id else self._get_user_id(event.unified_msg_origin)
 
-        # Find and remove matching timers
-        removed = []
-        for timer_id, timer_data in list(self.timers.items()):
-            if timer_data.get("boss") != boss_name:
-                continue
-
-            # Match location
-            location_match = False
-            if group_id:
-                location_match = timer_data.get("group_id") == group_id
-            else:
-                location_match = timer_data.get("user_id") == current_user_id
-
-            if location_match:
-                # Cancel scheduled jobs
-                scheduler.cancel_reminder_jobs(self.scheduler, timer_id)
-                del self.timers[timer_id]
-                removed.append(timer_id)
+        # Find and remove matching timers (only this chat's timers for the boss)
+        scope_key = self._scope_key(group_id, current_user_id)
+        # The popped set is already detached from the index, so no copy is needed
+        scope_timers = self._by_scope.get(scope_key)
+        removed = scope_timers.pop(boss_name, set()) if scope_timers else set()
+        if scope_timers is not None and not scope_timers:
+            del self._by_scope[scope_key]
+        for timer_id in removed:
+            # Cancel scheduled jobs
+            scheduler.cancel_reminder_jobs(self.scheduler, timer_id, self._timer_jobs)
+            del self.timers[timer_id]
 
         if removed:
-            timer_storage.save_timers(self.data_dir, self.timers)
+            self._mark_timers_dirty(*removed)
             display_name = boss_config.get_boss_display_name(boss_name, self.bosses)
             yield MessageEventResult().message(
                 f"✅ 已取消 {display_name} 的计时器\n使用 /boss list 查看剩余计时器"
@@ -570,7 +743,7 @@ class BossTimer(Star):
         group_id = event.get_group_id()
 
         # Resolve boss name
-        boss_name = boss_config.get_boss_by_alias(zhconv.convert(boss_input, 'zh-cn').lower(), self.boss_alias_map)
+        boss_name = boss_config.get_boss_by_alias(_to_simplified(boss_input), self.boss_alias_map)
         if not boss_name:
             yield MessageEventResult().message(
                 f"❌ 未找到boss：{boss_input}\n使用 /boss help 查看所有支持的boss"
@@ -579,14 +752,15 @@ class BossTimer(Star):
 
         # Check group boss filter
         if group_id:
-            allowed_bosses = permission.get_allowed_bosses_for_group(group_id, self.config)
+            allowed_bosses = self._get_allowed_bosses(group_id)
             if allowed_bosses is not None and boss_name not in allowed_bosses:
                 logger.debug(f"Boss {boss_name} not allowed in group {group_id}")
                 return
 
         # Parse spawn time
+        now = datetime.now(self.timezone)
         try:
-            spawn_time = time_utils.parse_spawn_time(spawn_time_str, self.timezone)
+            spawn_time = time_utils.parse_spawn_time(spawn_time_str, self.timezone, now)
         except ValueError as e:
             yield MessageEventResult().message(
                 f"❌ 时间格式错误：{e}\n\n支持的格式：\n"
@@ -596,7 +770,6 @@ class BossTimer(Star):
             return
 
         # Check if spawn time is in the future
-        now = datetime.now(self.timezone)
         if spawn_time <= now:
             yield MessageEventResult().message(
                 f"❌ 刷新时间必须在未来\n"
@@ -606,46 +779,45 @@ class BossTimer(Star):
             return
 
         current_user_id = None if group_id else self._get_user_id(event.unified_msg_origin)
-
-        # Create timer_id without timestamp (so same boss overwrites)
-        if group_id:
-            timer_id = f"{group_id}_{boss_name}"
-            umo = f"qq_group_{group_id}"
-        else:
-            timer_id = f"private_{current_user_id}_{boss_name}"
-            umo = event.unified_msg_origin
+        timer_id = self._make_timer_id(group_id, current_user_id, boss_name)
+        # Remind via the real message origin, as death reports do; a fabricated
+        # "qq_group_<id>" string is not deliverable on most platform adapters.
+        umo = event.unified_msg_origin
 
         # Remove old timer and scheduled jobs if exists
         if timer_id in self.timers:
-            scheduler.cancel_reminder_jobs(self.scheduler, timer_id)
-            del self.timers[timer_id]
+            scheduler.cancel_reminder_jobs(self.scheduler, timer_id, self._timer_jobs)
+            self._unindex_timer(timer_id, self.timers.pop(timer_id))
 
         self.timers[timer_id] = {
             "boss": boss_name,
             "spawn_time": spawn_time.isoformat(),
+            "_spawn_dt": spawn_time,
             "umo": umo,
             "group_id": group_id,
             "user_id": current_user_id,
         }
+        self._index_timer(timer_id, self.timers[timer_id])
 
         # Schedule reminders
-        intervals = scheduler.get_reminder_intervals(self.config)
+        display_name = boss_config.get_boss_display_name(boss_name, self.bosses)
         scheduler.schedule_reminders(
             self.scheduler,
             timer_id,
-            boss_name,
+            display_name,
             spawn_time,
             umo,
             self._send_reminder,
-            intervals,
+            self._reminder_intervals,
             self.timezone,
+            now,
+            self._timer_jobs,
         )
 
         # Save timers
-        timer_storage.save_timers(self.data_dir, self.timers)
+        self._mark_timers_dirty(timer_id)
 
         # Send confirmation
-        display_name = boss_config.get_boss_display_name(boss_name, self.bosses)
         message = formatter.format_timer_added_message(
             display_name,
             spawn_time,
@@ -669,21 +841,25 @@ class BossTimer(Star):
                 yield MessageEventResult().message("❌ 只有群管理员才能执行重置操作")
                 return
 
-        # Cancel all scheduled jobs
-        cancelled_jobs = 0
-        for job in self.scheduler.get_jobs():
-            try:
-                job.remove()
-                cancelled_jobs += 1
-            except Exception as e:
-                logger.error(f"Failed to cancel job {job.id}: {e}")
+        # Cancel all scheduled jobs in one call (Lib Mini jobs are re-added below).
+        # Report only boss reminder jobs still pending; the flush and Lib Mini
+        # jobs are internal, and fired date jobs linger in the index.
+        cancelled_jobs = sum(
+            1
+            for job_ids in self._timer_jobs.values()
+            for job_id in job_ids
+            if self.scheduler.get_job(job_id) is not None
+        )
+        self.scheduler.remove_all_jobs()
 
         # Clear all timers
         timer_count = len(self.timers)
         self.timers.clear()
+        self._by_scope.clear()
+        self._timer_jobs.clear()
 
         # Save empty timers
-        timer_storage.save_timers(self.data_dir, self.timers)
+        self._mark_timers_dirty()
         self._schedule_lib_mini_reminders()
 
         # Send confirmation
@@ -769,14 +945,14 @@ class BossTimer(Star):
     @filter.command("map", alias={"地图"}, priority=100)
     async def show_map(self, event: AstrMessageEvent, map_input: GreedyStr = ""):
         """Show a map by name, alias, or ID. Usage: /map 森林"""
-        map_input = zhconv.convert(map_input.strip(), 'zh-cn')
+        map_input = _to_simplified(map_input.strip())
         event.stop_event()
         if not map_input:
             async for result in self.list_maps(event):
                 yield result
             return
 
-        if map_input.lower() in ["list", "ls", "列表", "地图", "help", "帮助"]:
+        if map_input.lower() in _MAP_LIST_KEYWORDS:
             async for result in self.list_maps(event):
                 yield result
             return
@@ -790,25 +966,7 @@ class BossTimer(Star):
             yield MessageEventResult().message("❌ 没有找到地图数据")
             return
 
-        # Group maps by category
-        maps_by_category = map_config.get_maps_by_category(self.maps)
-
-        # Format output
-        lines = ["🗺️ 可用地图列表：\n"]
-        for category, map_list in sorted(maps_by_category.items()):
-            lines.append(f"【{category}】")
-            for map_data in map_list:
-                map_id = map_data.get("id")
-                name = map_data.get("name")
-                aliases = map_data.get("aliases", [])
-                alias_str = "、".join(aliases[:2]) if aliases else ""
-                lines.append(f"  {map_id}. {name} ({alias_str})")
-            lines.append("")
-
-        lines.append("使用方法：/map <地图名或别名>")
-        lines.append("例如：/map 森林 或 /map 1")
-
-        yield MessageEventResult().message("\n".join(lines))
+        yield MessageEventResult().message(self._map_list_message)
 
     async def _send_map(self, event: AstrMessageEvent, map_input: str):
         """Internal method to send map image"""
@@ -821,24 +979,18 @@ class BossTimer(Star):
             )
             return
 
-        # Get map file path
+        # Get map file path (resolved once at startup)
         map_file = map_data.get("file")
-        map_path = self.assets_dir / "imo_maps_new" / map_file
-        if not map_path.exists():
-            map_path = self.assets_dir / map_file
-        if not map_path.exists():
-            map_path = self.assets_dir / "IMO地图查看器_files" / map_file
-
-        if not map_path.exists():
+        map_path = self._map_paths.get(map_file)
+        if map_path is None:
             yield MessageEventResult().message(f"❌ 地图文件不存在：{map_file}")
-            logger.error(f"Map file not found: {map_path}")
+            logger.error(f"Map file not found: {map_file}")
             return
 
-        # Send the map image
+        # Send the title and image as one message chain (one send instead of two)
         try:
             map_name = map_data.get("name")
-            yield event.plain_result(f"🗺️ {map_name}")
-            yield event.image_result(str(map_path))
+            yield MessageEventResult().message(f"🗺️ {map_name}").file_image(map_path)
         except Exception as e:
             logger.error(f"Failed to send map image: {e}")
             yield MessageEventResult().message(f"❌ 发送地图失败：{e}")
@@ -847,5 +999,7 @@ class BossTimer(Star):
         """Cleanup on shutdown"""
         logger.info("Shutting down TWOM Boss Timer plugin")
         self.scheduler.shutdown(wait=True)
-        timer_storage.save_timers(self.data_dir, self.timers)
+        # Wait out any in-flight background write, then save what is left
+        async with self._flush_lock:
+            self._flush_timers()
         logger.info("TWOM Boss Timer plugin terminated")
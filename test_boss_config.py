@@ -1,4 +1,6 @@
 import json
+import os
+import tempfile
 import unittest
 from pathlib import Path
 import sys
@@ -33,9 +35,13 @@ class ParseBossDeathCommandTests(unittest.TestCase):
         ) as f:
             bosses = json.load(f)
         cls.alias_map = boss_config.build_alias_map(bosses)
+        cls.first_chars = boss_config.build_alias_first_chars(cls.alias_map)
+        cls.death_tokens = boss_config.build_death_token_map(cls.alias_map)
 
     def parse(self, message):
-        return boss_config.parse_boss_death_command(message, self.alias_map)
+        return boss_config.parse_boss_death_command(
+            message, self.alias_map, self.first_chars, self.death_tokens
+        )
 
     def test_multiword_alias_with_space_keyword(self):
         # "red bee" must resolve to rb, NOT the Red boss.
@@ -61,16 +67,62 @@ class ParseBossDeathCommandTests(unittest.TestCase):
     def test_with_space_cjk(self):
         self.assertEqual(self.parse("大树 d").boss_name, "大树")
 
+    def test_full_width_and_repeated_spaces(self):
+        result = self.parse("red　bee   d　12:00")
+        self.assertEqual(result.boss_name, "rb")
+        self.assertEqual(result.time_part, "12:00")
+
     def test_unknown_boss_with_space_reports(self):
         result = self.parse("mushland d")
         self.assertIsNone(result.boss_name)
         self.assertTrue(result.has_space_before_d)
         self.assertEqual(result.boss_input, "mushland")
 
+    def test_precomputed_lookups_match_plain_lookup(self):
+        messages = ["red bee d", "red", "redd", "大树d 12:00", "mushland d", "good", "zzz d", "zzzd"]
+        messages += [alias for alias in self.alias_map if " " not in alias]
+        messages += [alias + "d" for alias in self.alias_map if " " not in alias]
+        for message in messages:
+            with self.subTest(message=message):
+                self.assertEqual(
+                    self.parse(message),
+                    boss_config.parse_boss_death_command(message, self.alias_map),
+                )
+
     def test_not_a_death_report(self):
         self.assertIsNone(self.parse("hello world"))
         self.assertIsNone(self.parse("snake 12:00"))
 
 
+class BuildAliasMapTests(unittest.TestCase):
+    def test_reuses_map_for_same_bosses_dict(self):
+        bosses = {"wdk": {"display_name": "WDK", "aliases": ["Dragon"]}}
+
+        alias_map = boss_config.build_alias_map(bosses)
+
+        self.assertEqual(alias_map, {"wdk": "wdk", "dragon": "wdk"})
+        self.assertIs(boss_config.build_alias_map(bosses), alias_map)
+        self.assertEqual(boss_config.build_alias_map({"red": {}}), {"red": "red"})
+
+
+class LoadBossesTests(unittest.TestCase):
+    def test_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bosses.json"
+            path.write_text(json.dumps({"wdk": {"display_name": "WDK"}}), encoding="utf-8")
+
+            first = boss_config.load_bosses(path)
+            self.assertIs(boss_config.load_bosses(path), first)
+
+            path.write_text(json.dumps({"red": {"display_name": "Red"}}), encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertEqual(list(boss_config.load_bosses(path)), ["red"])
+
+    def test_missing_file(self):
+        self.assertEqual(boss_config.load_bosses(Path("/nonexistent/bosses.json")), {})
+
+
 if __name__ == "__main__":
     unittest.main()
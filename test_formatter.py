@@ -2,6 +2,7 @@ import unittest
 from pathlib import Path
 import sys
 import types
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
 astrbot_module = types.ModuleType("astrbot")
@@ -55,6 +56,51 @@ class FormatTimerListTests(unittest.TestCase):
         self.assertIn("15:20", message)
         self.assertNotIn("15:30", message)
 
+    def test_sorts_by_spawn_time_and_shows_primary_timezone(self):
+        timers = {
+            "100_late": {"boss": "late", "spawn_time": "2026-06-11T18:00:00+00:00"},
+            "100_early": {"boss": "early", "spawn_time": "2026-06-11T23:00:00+08:00"},
+        }
+        bosses = {"late": {"display_name": "Late"}, "early": {"display_name": "Early"}}
+
+        message = formatter.format_timer_list(
+            timers,
+            bosses,
+            ZoneInfo("UTC"),
+            show_secondary=False,
+        )
+
+        self.assertLess(message.index("Early"), message.index("Late"))
+        self.assertIn("Early：06月11日 15:00:00", message)
+
+    def test_limit_keeps_soonest_spawns(self):
+        timers = {
+            "100_a": {"boss": "a", "spawn_time": "2026-06-11T18:00:00+00:00"},
+            "100_b": {"boss": "b", "spawn_time": "2026-06-11T16:00:00+00:00"},
+            "100_c": {"boss": "c", "spawn_time": "2026-06-11T17:00:00+00:00"},
+        }
+
+        message = formatter.format_timer_list(
+            timers, {}, ZoneInfo("UTC"), show_secondary=False, limit=2
+        )
+
+        self.assertLess(message.index("b："), message.index("c："))
+        self.assertNotIn("a：", message)
+
+    def test_uses_cached_spawn_time(self):
+        spawn_time = datetime(2026, 6, 11, 9, 45, tzinfo=ZoneInfo("UTC"))
+        timers = {
+            "100_boss_a": {
+                "boss": "boss_a",
+                "spawn_time": "not parsed when cached",
+                "_spawn_dt": spawn_time,
+            }
+        }
+
+        message = formatter.format_timer_list(timers, {}, ZoneInfo("UTC"), show_secondary=False)
+
+        self.assertIn("boss_a：06月11日 09:45:00", message)
+
 
 if __name__ == "__main__":
     unittest.main()
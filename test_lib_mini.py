@@ -44,6 +44,7 @@ class LibMiniReminderTests(unittest.TestCase):
             "书库d",
             "书库 mini d",
             "书库mini d",
+            "　lib\u3000mini  d　",
         ]
 
         for message in matching_messages:
@@ -0,0 +1,117 @@
+import sys
+import tempfile
+import types
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+try:
+    import apscheduler
+    import zhconv
+except ImportError:  # main.py needs both; skip rather than stub them
+    apscheduler = zhconv = None
+
+
+class LoggerStub:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FilterStub:
+    class EventMessageType:
+        ALL = "all"
+
+    @staticmethod
+    def event_message_type(*args, **kwargs):
+        return lambda handler: handler
+
+    command = event_message_type
+
+    @staticmethod
+    def command_group(*args, **kwargs):
+        def decorator(handler):
+            handler.command = FilterStub.event_message_type
+            return handler
+
+        return decorator
+
+
+class StarStub:
+    def __init__(self, context):
+        pass
+
+
+class MessageEventResultStub:
+    def __init__(self):
+        self.text = None
+        self.chain = []
+
+    def message(self, text):
+        self.text = text
+        return self
+
+
+def stub_module(name, **attrs):
+    module = sys.modules.setdefault(name, types.ModuleType(name))
+    for attr, value in attrs.items():
+        setattr(module, attr, value)
+    return module
+
+
+stub_module("astrbot")
+stub_module("astrbot.api", logger=LoggerStub())
+stub_module("astrbot.api.event", AstrMessageEvent=object, filter=FilterStub)
+stub_module("astrbot.api.star", Context=object, Star=StarStub, register=lambda *args: lambda cls: cls)
+stub_module("astrbot.core.message.components", Node=object, Nodes=object, Plain=object)
+stub_module("astrbot.core.message.message_event_result", MessageEventResult=MessageEventResultStub)
+stub_module("astrbot.core.star.filter.command", GreedyStr=str)
+stub_module("astrbot.core.utils.astrbot_path", get_astrbot_data_path=None)
+
+# main.py uses package-relative imports, so load it as a package submodule
+plugin_package = types.ModuleType("twom_plugin")
+plugin_package.__path__ = [str(Path(__file__).parent)]
+sys.modules.setdefault("twom_plugin", plugin_package)
+
+
+class FakeEvent:
+    def __init__(self, group_id, unified_msg_origin):
+        self.group_id = group_id
+        self.unified_msg_origin = unified_msg_origin
+
+    def get_group_id(self):
+        return self.group_id
+
+    def stop_event(self):
+        pass
+
+
+@unittest.skipIf(apscheduler is None or zhconv is None, "apscheduler/zhconv not installed")
+class BossAddTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        from twom_plugin import main
+
+        data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(data_dir.cleanup)
+        with mock.patch.object(main, "get_astrbot_data_path", return_value=data_dir.name):
+            self.plugin = main.BossTimer(context=None, config={"reminder_intervals": "3"})
+
+    async def asyncTearDown(self):
+        self.plugin.scheduler.shutdown(wait=False)
+
+    async def test_group_reminder_goes_to_event_origin(self):
+        event = FakeEvent("100", "aiocqhttp:GroupMessage:100")
+        # Far enough ahead that the 3-minute reminder is always in the future
+        spawn_time = datetime.now(self.plugin.timezone) + timedelta(hours=1)
+
+        async for _ in self.plugin.boss_add_spawn_timer(event, "wdk", f"{spawn_time:%H:%M:%S}"):
+            pass
+
+        self.assertEqual(self.plugin.timers["100_wdk"]["umo"], event.unified_msg_origin)
+        job = self.plugin.scheduler.get_job("100_wdk_remind_3min")
+        self.assertIsNotNone(job)
+        self.assertEqual(job.args[2], event.unified_msg_origin)
+
+
+if __name__ == "__main__":
+    unittest.main()
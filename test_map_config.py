@@ -30,11 +30,48 @@ class MapCommandParsingTests(unittest.TestCase):
         self.assertEqual(map_config.parse_map_command("/map 森林"), "森林")
         self.assertEqual(map_config.parse_map_command("/map   lh1"), "lh1")
         self.assertEqual(map_config.parse_map_command("/map"), "")
+        self.assertEqual(map_config.parse_map_command("　/map　森林\t "), "森林")
 
     def test_ignores_non_map_messages(self):
         self.assertIsNone(map_config.parse_map_command("map 4"))
         self.assertIsNone(map_config.parse_map_command("/boss list"))
 
 
+class LoadMapsTests(unittest.TestCase):
+    def test_reuses_parsed_maps_and_alias_map(self):
+        assets_dir = Path(__file__).parent / "assets"
+
+        maps = map_config.load_maps(assets_dir)
+
+        self.assertTrue(maps)
+        self.assertIs(map_config.load_maps(assets_dir), maps)
+        self.assertIs(
+            map_config.build_map_alias_map(maps),
+            map_config.build_map_alias_map(map_config.load_maps(assets_dir)),
+        )
+
+    def test_missing_maps_file(self):
+        self.assertEqual(map_config.load_maps(Path("/nonexistent")), [])
+
+
+class ResolveMapFilesTests(unittest.TestCase):
+    def test_resolves_bundled_map_images(self):
+        assets_dir = Path(__file__).parent / "assets"
+        maps = map_config.load_maps(assets_dir)
+
+        paths = map_config.resolve_map_files(maps, assets_dir)
+
+        self.assertTrue(paths)
+        for map_file, map_path in paths.items():
+            self.assertIsInstance(map_path, str)
+            self.assertEqual(Path(map_path).name, map_file)
+            self.assertTrue(Path(map_path).exists())
+
+    def test_omits_missing_files(self):
+        maps = [{"name": "missing", "file": "does-not-exist.webp"}]
+
+        self.assertEqual(map_config.resolve_map_files(maps, Path(__file__).parent / "assets"), {})
+
+
 if __name__ == "__main__":
     unittest.main()
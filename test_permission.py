@@ -68,5 +68,120 @@ class ResetPermissionTests(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(await permission.can_reset_timers(event))
 
 
+class GroupSetTests(unittest.TestCase):
+    CONFIG = {
+        "whitelist_enabled": True,
+        "whitelist_groups": [100, "101"],
+        "core_groups": ["102"],
+        "whitelist_groups_2": ["200"],
+        "core_groups_2": [201],
+    }
+
+    def test_finds_set_for_whitelist_and_core_groups(self):
+        self.assertEqual(permission.get_group_set("100", self.CONFIG), 1)
+        self.assertEqual(permission.get_group_set(102, self.CONFIG), 1)
+        self.assertEqual(permission.get_group_set("201", self.CONFIG), 2)
+        self.assertIsNone(permission.get_group_set("999", self.CONFIG))
+        self.assertEqual(permission.get_all_groups_in_set(2, self.CONFIG), {"200", "201"})
+        self.assertEqual(permission.get_all_groups_in_set(7, self.CONFIG), set())
+
+    def test_group_listed_in_two_sets_belongs_to_lowest(self):
+        config = {"whitelist_groups_3": ["300"], "core_groups_2": ["300"]}
+
+        self.assertEqual(permission.get_group_set("300", config), 2)
+
+    def test_core_groups(self):
+        self.assertTrue(permission.is_core_group("201", self.CONFIG))
+        self.assertFalse(permission.is_core_group("200", self.CONFIG))
+
+    def test_picks_up_changed_group_lists(self):
+        config = {"whitelist_enabled": True, "whitelist_groups": ["100"]}
+        self.assertTrue(permission.is_group_enabled("100", config))
+
+        config["whitelist_groups"] = ["101"]
+        self.assertFalse(permission.is_group_enabled("100", config))
+        self.assertTrue(permission.is_group_enabled("101", config))
+
+    def test_user_whitelist_matches_as_strings_and_picks_up_changes(self):
+        config = {"whitelist_users": [7, "8"]}
+        self.assertTrue(permission.is_user_enabled("7", config))
+        self.assertTrue(permission.is_user_enabled(8, config))
+
+        config["whitelist_users"] = ["9"]
+        self.assertFalse(permission.is_user_enabled("7", config))
+        self.assertTrue(permission.is_user_enabled("9", config))
+        self.assertFalse(permission.is_user_enabled("9", {"whitelist_users": []}))
+
+
+class TimerVisibilityTests(unittest.TestCase):
+    CONFIG = {
+        "whitelist_groups": ["100"],
+        "core_groups": ["101"],
+        "whitelist_groups_2": ["200"],
+    }
+    TIMERS = {
+        "100_wdk": {"group_id": "100"},
+        "101_red": {"group_id": "101"},
+        "200_wdk": {"group_id": "200"},
+        "private_7_wdk": {"group_id": None, "user_id": "7"},
+        "private_8_wdk": {"group_id": None, "user_id": "8"},
+    }
+
+    def visible(self, group_id, user_id=None):
+        show = permission.make_timer_filter(group_id, user_id, self.CONFIG)
+        visible = {timer_id for timer_id, data in self.TIMERS.items() if show(timer_id, data)}
+        # The single-timer helper must agree with the prebuilt filter
+        for timer_id, data in self.TIMERS.items():
+            self.assertEqual(
+                permission.should_show_timer(timer_id, data, group_id, user_id, self.CONFIG),
+                timer_id in visible,
+            )
+        return visible
+
+    def test_private_viewer_sees_only_own_private_timers(self):
+        self.assertEqual(self.visible(None, "7"), {"private_7_wdk"})
+
+    def test_normal_group_sees_only_own_timers(self):
+        self.assertEqual(self.visible("100"), {"100_wdk"})
+        self.assertEqual(self.visible("200"), {"200_wdk"})
+
+    def test_core_group_sees_whole_set(self):
+        self.assertEqual(self.visible("101"), {"100_wdk", "101_red"})
+
+    def test_uses_stored_owner_not_timer_id(self):
+        show = permission.make_timer_filter("100", None, self.CONFIG)
+
+        self.assertTrue(show("renamed", {"group_id": "100"}))
+        self.assertFalse(show("100_wdk", {"group_id": None, "user_id": "100"}))
+
+
+class GroupBossFilterTests(unittest.TestCase):
+    def config(self, filters):
+        return {"group_boss_filter_enabled": True, "group_boss_filters": filters}
+
+    def test_returns_filter_for_configured_group(self):
+        config = self.config('{"100": ["wdk", "red"], "200": []}')
+
+        self.assertEqual(permission.get_allowed_bosses_for_group("100", config), {"wdk", "red"})
+        self.assertIsNone(permission.get_allowed_bosses_for_group("200", config))
+        self.assertIsNone(permission.get_allowed_bosses_for_group("300", config))
+
+    def test_picks_up_changed_filters(self):
+        self.assertEqual(
+            permission.get_allowed_bosses_for_group(100, self.config('{"100": ["wdk"]}')),
+            {"wdk"},
+        )
+        self.assertEqual(
+            permission.get_allowed_bosses_for_group(100, self.config('{"100": ["red"]}')),
+            {"red"},
+        )
+
+    def test_invalid_json_or_disabled_means_no_filter(self):
+        self.assertIsNone(permission.get_allowed_bosses_for_group("100", self.config("{oops")))
+        self.assertIsNone(
+            permission.get_allowed_bosses_for_group("100", {"group_boss_filters": '{"100": ["wdk"]}'})
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import sys
 import types
 import unittest
+from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -25,6 +26,79 @@ sys.modules.setdefault("utils", utils_module)
 import utils.time_utils as time_utils
 
 
+class InitTimezoneTests(unittest.TestCase):
+    def test_reuses_zone_and_falls_back_on_invalid_name(self):
+        tz = time_utils.init_timezone("America/Toronto")
+
+        self.assertIs(time_utils.init_timezone("America/Toronto"), tz)
+        self.assertEqual(time_utils.init_timezone("Not/AZone"), ZoneInfo("Asia/Shanghai"))
+
+
+class FormatTimeTests(unittest.TestCase):
+    def test_matches_strftime_for_both_timezones(self):
+        dt = datetime(2026, 1, 10, 15, 30, 5, tzinfo=ZoneInfo("Asia/Shanghai"))
+        toronto = ZoneInfo("America/Toronto")
+
+        self.assertEqual(
+            time_utils.format_time(dt, secondary_tz=toronto),
+            "01月10日 15:30:05 | 🍁 01月10日 02:30:05",
+        )
+        self.assertEqual(time_utils.format_time_short(dt, show_secondary=False), "15:30:05")
+        self.assertEqual(
+            time_utils.format_time_short(dt, secondary_tz=dt.tzinfo), "15:30:05 | 🍁 15:30:05"
+        )
+        self.assertEqual(
+            time_utils.format_time_short(dt, secondary_tz=toronto),
+            time_utils.format_time(dt, show_date=False, secondary_tz=toronto),
+        )
+
+
+class ParseSpawnTimeTests(unittest.TestCase):
+    def test_parses_clock_with_optional_seconds(self):
+        tz = ZoneInfo("UTC")
+
+        spawn_time = time_utils.parse_spawn_time("7：05", tz)
+        self.assertEqual((spawn_time.hour, spawn_time.minute, spawn_time.second), (7, 5, 0))
+
+        spawn_time = time_utils.parse_spawn_time("01-11 15:30:45", tz)
+        self.assertEqual(
+            (spawn_time.month, spawn_time.day, spawn_time.hour, spawn_time.second), (1, 11, 15, 45)
+        )
+
+    def test_rolls_over_relative_to_given_now(self):
+        tz = ZoneInfo("UTC")
+        now = datetime(2026, 12, 31, 23, 0, tzinfo=tz)
+
+        self.assertEqual(
+            time_utils.parse_spawn_time("22:00", tz, now), datetime(2027, 1, 1, 22, 0, tzinfo=tz)
+        )
+        self.assertEqual(
+            time_utils.parse_spawn_time("12-31 22:00", tz, now),
+            datetime(2027, 12, 31, 22, 0, tzinfo=tz),
+        )
+        self.assertEqual(
+            time_utils.parse_spawn_time("12-31 23:00:01", tz, now),
+            datetime(2026, 12, 31, 23, 0, 1, tzinfo=tz),
+        )
+
+    def test_accepts_full_width_digits(self):
+        tz = ZoneInfo("UTC")
+        now = datetime(2026, 6, 11, 8, 0, tzinfo=tz)
+
+        self.assertEqual(
+            time_utils.parse_spawn_time("１５：３０", tz, now), datetime(2026, 6, 11, 15, 30, tzinfo=tz)
+        )
+        self.assertEqual(
+            time_utils.parse_spawn_time("０６-１２ １５:３０", tz, now),
+            datetime(2026, 6, 12, 15, 30, tzinfo=tz),
+        )
+
+    def test_rejects_malformed_clock(self):
+        for text in ("15", "15:3x", "15:30:45:00", "150:30", "01-11 15"):
+            with self.assertRaises(ValueError, msg=text):
+                time_utils.parse_spawn_time(text, ZoneInfo("UTC"))
+
+
 class ParseDeathTimeTests(unittest.TestCase):
     def test_ignores_non_time_drop_note_after_death_marker(self):
         death_time = time_utils.parse_death_time("osos", ZoneInfo("UTC"))
@@ -44,6 +118,14 @@ class ParseDeathTimeTests(unittest.TestCase):
         self.assertEqual(death_time.minute, 34)
         self.assertEqual(death_time.second, 0)
 
+    def test_accepts_full_width_clock_time(self):
+        tz = ZoneInfo("UTC")
+        now = datetime(2026, 6, 11, 15, 0, tzinfo=tz)
+
+        death_time = time_utils.parse_death_time("１２:３０", tz, now)
+
+        self.assertEqual(death_time, datetime(2026, 6, 11, 12, 30, tzinfo=tz))
+
     def test_rejects_invalid_time_like_text_after_death_marker(self):
         with self.assertRaises(ValueError):
             time_utils.parse_death_time("99:99", ZoneInfo("UTC"))
@@ -52,5 +134,19 @@ class ParseDeathTimeTests(unittest.TestCase):
             time_utils.parse_death_time("60", ZoneInfo("UTC"))
 
 
+class ParseIsoTimeTests(unittest.TestCase):
+    def test_keeps_embedded_offset(self):
+        parsed = time_utils.parse_iso_time("2026-06-11T15:30:00+08:00", ZoneInfo("UTC"))
+
+        self.assertEqual(parsed.utcoffset().total_seconds(), 8 * 3600)
+        self.assertEqual(parsed.hour, 15)
+
+    def test_attaches_timezone_to_naive_value(self):
+        tz = ZoneInfo("Asia/Shanghai")
+        parsed = time_utils.parse_iso_time("2026-06-11T15:30:00", tz)
+
+        self.assertIs(parsed.tzinfo, tz)
+
+
 if __name__ == "__main__":
     unittest.main()
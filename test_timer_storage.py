@@ -0,0 +1,145 @@
+import json
+import sys
+import tempfile
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+astrbot_module = types.ModuleType("astrbot")
+astrbot_api_module = types.ModuleType("astrbot.api")
+astrbot_api_module.logger = type(
+    "LoggerStub",
+    (),
+    {
+        "debug": lambda *args, **kwargs: None,
+        "warning": lambda *args, **kwargs: None,
+        "error": lambda *args, **kwargs: None,
+    },
+)()
+sys.modules.setdefault("astrbot", astrbot_module)
+sys.modules.setdefault("astrbot.api", astrbot_api_module)
+
+utils_module = types.ModuleType("utils")
+utils_module.__path__ = [str(Path(__file__).parent / "utils")]
+sys.modules.setdefault("utils", utils_module)
+
+import utils.timer_storage as timer_storage
+
+
+class TimerStorageTests(unittest.TestCase):
+    def test_save_skips_in_memory_keys(self):
+        spawn_time = datetime(2026, 6, 11, 15, 30, tzinfo=ZoneInfo("UTC"))
+        timers = {
+            "100_wdk": {
+                "boss": "wdk",
+                "spawn_time": spawn_time.isoformat(),
+                "_spawn_dt": spawn_time,
+            }
+        }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            timer_storage.save_timers(Path(tmp), timers)
+            with open(Path(tmp) / "timers.json", encoding="utf-8") as f:
+                saved = json.load(f)
+
+        self.assertEqual(saved, {"100_wdk": {"boss": "wdk", "spawn_time": spawn_time.isoformat()}})
+        self.assertIn("_spawn_dt", timers["100_wdk"])
+
+    def test_get_spawn_time_parses_once_and_caches(self):
+        tz = ZoneInfo("UTC")
+        timer_data = {"spawn_time": "2026-06-11T15:30:00+00:00"}
+
+        spawn_time = timer_storage.get_spawn_time(timer_data, tz)
+
+        self.assertEqual(spawn_time, datetime(2026, 6, 11, 15, 30, tzinfo=tz))
+        self.assertIs(timer_data["_spawn_dt"], spawn_time)
+        self.assertIs(timer_storage.get_spawn_time(timer_data, tz), spawn_time)
+
+    def test_get_spawn_time_converts_to_plugin_timezone(self):
+        tz = ZoneInfo("Asia/Shanghai")
+        timer_data = {"spawn_time": "2026-06-11T15:30:00+00:00"}
+
+        spawn_time = timer_storage.get_spawn_time(timer_data, tz)
+
+        self.assertIs(spawn_time.tzinfo, tz)
+        self.assertEqual(spawn_time.hour, 23)
+
+    def test_load_drops_malformed_timers_and_caches_spawn_time(self):
+        tz = ZoneInfo("UTC")
+        raw = {
+            "100_wdk": {"boss": "wdk", "spawn_time": "2026-06-11T15:30:00+00:00"},
+            "100_bmm": {"boss": "bmm"},
+            "100_uk": {"boss": "uk", "spawn_time": "not a time"},
+        }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(Path(tmp) / "timers.json", "w", encoding="utf-8") as f:
+                json.dump(raw, f)
+            timers = timer_storage.load_timers(Path(tmp), tz)
+
+        self.assertEqual(list(timers), ["100_wdk"])
+        self.assertEqual(
+            timers["100_wdk"]["_spawn_dt"],
+            datetime(2026, 6, 11, 15, 30, tzinfo=tz),
+        )
+
+    def test_load_normalizes_owner_of_legacy_timers(self):
+        raw = {
+            "100_wdk": {"boss": "wdk", "spawn_time": "2026-06-11T15:30:00+00:00"},
+            "private_7_red": {"boss": "red", "spawn_time": "2026-06-11T15:30:00+00:00"},
+            "200_uk": {"boss": "uk", "spawn_time": "2026-06-11T15:30:00+00:00", "group_id": 200},
+        }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(Path(tmp) / "timers.json", "w", encoding="utf-8") as f:
+                json.dump(raw, f)
+            timers = timer_storage.load_timers(Path(tmp), ZoneInfo("UTC"))
+
+        self.assertEqual(timers["100_wdk"]["group_id"], "100")
+        self.assertIsNone(timers["100_wdk"]["user_id"])
+        self.assertIsNone(timers["private_7_red"]["group_id"])
+        self.assertEqual(timers["private_7_red"]["user_id"], "7")
+        self.assertEqual(timers["200_uk"]["group_id"], "200")
+
+
+class TimerJournalTests(unittest.TestCase):
+    def test_journaled_changes_replay_and_compact_on_load(self):
+        tz = ZoneInfo("UTC")
+        timers = {
+            "100_wdk": {"boss": "wdk", "spawn_time": "2026-06-11T15:30:00+00:00"},
+            "100_bmm": {"boss": "bmm", "spawn_time": "2026-06-11T16:00:00+00:00"},
+        }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            timer_storage.save_timers(data_dir, timers)
+
+            timers["100_uk"] = {"boss": "uk", "spawn_time": "2026-06-11T17:00:00+00:00"}
+            del timers["100_bmm"]
+            timer_storage.append_timer_changes(data_dir, timers, ["100_uk", "100_bmm"])
+            self.assertTrue((data_dir / timer_storage.JOURNAL_FILE).exists())
+
+            loaded = timer_storage.load_timers(data_dir, tz)
+
+            self.assertEqual(sorted(loaded), ["100_uk", "100_wdk"])
+            self.assertFalse((data_dir / timer_storage.JOURNAL_FILE).exists())
+            with open(data_dir / timer_storage.TIMERS_FILE, encoding="utf-8") as f:
+                self.assertEqual(sorted(json.load(f)), ["100_uk", "100_wdk"])
+
+    def test_torn_journal_line_is_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            timers = {"100_wdk": {"boss": "wdk", "spawn_time": "2026-06-11T15:30:00+00:00"}}
+            timer_storage.append_timer_changes(data_dir, timers, ["100_wdk"])
+            with open(data_dir / timer_storage.JOURNAL_FILE, "a", encoding="utf-8") as f:
+                f.write('{"op": "set", "id": "100_b')
+
+            loaded = timer_storage.load_timers(data_dir, ZoneInfo("UTC"))
+
+        self.assertEqual(list(loaded), ["100_wdk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,51 +6,116 @@ Handles loading boss data, alias mapping, and display names
 import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is the fallback
+    orjson = None
+
+# (bosses dict, alias map built from it); holding the dict keeps its id stable
+_alias_map_cache: Optional[Tuple[Dict, Dict[str, str]]] = None
+
+
+@lru_cache(maxsize=4)
+def _load_bosses_file(path: str, mtime_ns: int) -> Dict:
+    """Parse a bosses file; mtime_ns is only part of the cache key"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def load_bosses(default_bosses_path: Path) -> Dict:
     """
     Load boss configuration from default bosses file.
 
+    Parsed results are cached by path and modification time, so plugin
+    reloads only re-parse the file after it changes on disk. The returned
+    dictionary is shared between callers and must not be mutated.
+
     Args:
         default_bosses_path: Path to default_bosses.json
 
     Returns:
         Dictionary of boss configurations
     """
-    if default_bosses_path.exists():
-        with open(default_bosses_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    try:
+        mtime_ns = default_bosses_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _load_bosses_file(str(default_bosses_path), mtime_ns)
 
 
 def build_alias_map(bosses: Dict) -> Dict[str, str]:
     """
     Build alias to boss_name mapping.
 
+    The result for the last bosses dict is memoized by identity: load_bosses
+    returns the same (immutable by contract) dict until the file changes, so
+    plugin reloads reuse the map. The returned map must not be mutated.
+
     Args:
         bosses: Boss configuration dictionary
 
     Returns:
         Dictionary mapping lowercase alias to boss_name
     """
-    alias_map = {}
-    for boss_name, boss_data in bosses.items():
-        # Boss name itself is an alias
-        alias_map[boss_name.lower()] = boss_name
+    global _alias_map_cache
+    if _alias_map_cache is not None and _alias_map_cache[0] is bosses:
+        return _alias_map_cache[1]
+
+    # Boss name, display name, then configured aliases; later entries win,
+    # same as inserting them one by one
+    alias_map = {
+        alias.lower(): boss_name
+        for boss_name, boss_data in bosses.items()
+        for alias in (boss_name, boss_data.get("display_name"), *boss_data.get("aliases", ()))
+        if alias
+    }
+    _alias_map_cache = (bosses, alias_map)
+    return alias_map
 
-        # Add display name as alias
-        display_name = boss_data.get("display_name")
-        if display_name:
-            alias_map[display_name.lower()] = boss_name
 
-        # Add all configured aliases
-        for alias in boss_data.get("aliases", []):
-            alias_map[alias.lower()] = boss_name
+def build_alias_first_chars(alias_map: Dict[str, str]) -> FrozenSet[str]:
+    """
+    Collect the first character of every alias.
 
-    return alias_map
+    Lets the death-report parser rule out unknown boss input with one set
+    lookup before hashing the whole token.
+
+    Args:
+        alias_map: Alias mapping from :func:`build_alias_map`
+
+    Returns:
+        Frozenset of alias first characters
+    """
+    return frozenset(alias[0] for alias in alias_map if alias)
+
+
+def build_death_token_map(alias_map: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+    """
+    Precompute the no-space death forms ``<alias>d`` for single-token aliases.
+
+    Resolves the "longest before short" rule of :func:`parse_boss_death_command`
+    once at build time: a token that is itself an alias ending in ``d`` wins
+    over the same token read as ``<shorter alias>`` + ``d``.
+
+    Args:
+        alias_map: Alias mapping from :func:`build_alias_map`
+
+    Returns:
+        Dictionary mapping token -> (boss_name, boss_input)
+    """
+    death_tokens = {}
+    for alias, boss_name in alias_map.items():
+        if " " not in alias:
+            death_tokens[alias + "d"] = (boss_name, alias)
+    # Full-token matches take priority over the stripped reading
+    for alias, boss_name in alias_map.items():
+        if " " not in alias and alias.endswith("d"):
+            death_tokens[alias] = (boss_name, alias)
+    return death_tokens
 
 
 def get_boss_by_alias(alias: str, alias_map: Dict[str, str]) -> Optional[str]:
@@ -78,7 +143,10 @@ class BossDeathCommand:
 
 
 def parse_boss_death_command(
-    message: str, alias_map: Dict[str, str]
+    message: str,
+    alias_map: Dict[str, str],
+    alias_first_chars: Optional[FrozenSet[str]] = None,
+    death_tokens: Optional[Dict[str, Tuple[str, str]]] = None,
 ) -> Optional[BossDeathCommand]:
     """
     Parse a boss death report of the form ``<boss> d [time]`` or ``<boss>d [time]``.
@@ -92,16 +160,27 @@ def parse_boss_death_command(
     Args:
         message: Raw user message.
         alias_map: Alias mapping from :func:`build_alias_map`.
+        alias_first_chars: Optional result of :func:`build_alias_first_chars`;
+            input whose first character is not in it skips the alias lookup.
+        death_tokens: Optional result of :func:`build_death_token_map`; lets
+            the no-space form resolve with a single lookup.
 
     Returns:
         A :class:`BossDeathCommand` when the message looks like a death report
         (``boss_name`` is ``None`` when the boss alias is unknown), or ``None``
         when the message is not a death report at all.
     """
+    # Tokens are lowercased once here; alias_map keys are already lowercase,
+    # so lookups below hit alias_map directly instead of get_boss_by_alias.
     tokens = message.lower().split()
     if not tokens:
         return None
 
+    def lookup(boss_input: str) -> Optional[str]:
+        if alias_first_chars is not None and boss_input[0] not in alias_first_chars:
+            return None
+        return alias_map.get(boss_input)
+
     # Case A: standalone "d" death keyword — "<boss tokens> d [time tokens]".
     # The boss is everything before the first standalone "d" (longest sequence),
     # so multi-word aliases are matched before any shorter prefix.
@@ -111,7 +190,7 @@ def parse_boss_death_command(
         if not boss_input:
             return None
         time_part = " ".join(tokens[i + 1:]) or None
-        boss_name = get_boss_by_alias(boss_input, alias_map)
+        boss_name = lookup(boss_input)
         return BossDeathCommand(boss_name, boss_input, time_part, True)
 
     # Case B: no-space form "<boss>d [time]" — a single boss token ending in 'd'
@@ -121,13 +200,19 @@ def parse_boss_death_command(
         return None  # no death keyword present → not a death report
     time_part = " ".join(tokens[1:]) or None
 
+    if death_tokens is not None:
+        hit = death_tokens.get(first)
+        if hit:
+            return BossDeathCommand(hit[0], hit[1], time_part, False)
+        return BossDeathCommand(None, first[:-1], time_part, False)
+
     # Longest before short: try the full token first (boss name may end in 'd'),
     # then fall back to the token without the trailing 'd'.
-    boss_name = get_boss_by_alias(first, alias_map)
+    boss_name = lookup(first)
     if boss_name:
         return BossDeathCommand(boss_name, first, time_part, False)
     stripped = first[:-1]
-    boss_name = get_boss_by_alias(stripped, alias_map)
+    boss_name = lookup(stripped)
     return BossDeathCommand(boss_name, stripped, time_part, False)
 
 
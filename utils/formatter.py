@@ -3,11 +3,15 @@ Message formatting utilities for TWOM Boss Timer
 Handles creating user-friendly messages
 """
 
+import heapq
 import zoneinfo
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Optional
 
+from .boss_config import get_boss_display_name
 from .time_utils import format_time, format_time_short
+from .timer_storage import get_spawn_time
 
 
 def format_boss_spawn_message(
@@ -64,6 +68,7 @@ def format_timer_list(
     timezone: zoneinfo.ZoneInfo,
     secondary_tz: Optional[zoneinfo.ZoneInfo] = None,
     show_secondary: bool = True,
+    limit: Optional[int] = None,
 ) -> str:
     """
     Format timer list message.
@@ -74,6 +79,7 @@ def format_timer_list(
         timezone: Primary timezone
         secondary_tz: Optional secondary timezone
         show_secondary: Whether to show secondary timezone
+        limit: Only list this many of the soonest spawns (None for all)
 
     Returns:
         Formatted timer list message
@@ -83,41 +89,30 @@ def format_timer_list(
 
     # Collapse duplicate boss entries from multiple visible groups. Keep the
     # earliest spawn because that is the actionable next timer for the boss.
+    # Spawn times come from the per-timer "_spawn_dt" cache, so repeated
+    # renders don't re-parse them.
     deduped_timers = {}
-    for timer_id, timer_data in timers.items():
+    for timer_data in timers.values():
         boss_name = timer_data["boss"]
+        spawn_time = get_spawn_time(timer_data, timezone)
         existing = deduped_timers.get(boss_name)
-        spawn_time = datetime.fromisoformat(timer_data["spawn_time"])
-        existing_spawn_time = (
-            datetime.fromisoformat(existing[1]["spawn_time"])
-            if existing is not None
-            else None
-        )
-        if existing_spawn_time is None or spawn_time < existing_spawn_time:
-            deduped_timers[boss_name] = (timer_id, timer_data)
-
-    # Sort timers by spawn time
-    sorted_timers = sorted(
-        deduped_timers.values(),
-        key=lambda x: datetime.fromisoformat(x[1]["spawn_time"]),
-    )
-
-    lines = ["⏳ Boss计时器列表：\n"]
-    for timer_id, timer_data in sorted_timers:
-        boss_name = timer_data["boss"]
-        spawn_time_str = timer_data["spawn_time"]
+        if existing is None or spawn_time < existing[0]:
+            deduped_timers[boss_name] = (spawn_time, boss_name)
 
-        # Get display name
-        boss_data = bosses.get(boss_name, {})
-        emoji = boss_data.get("emoji", "")
-        display_name = boss_data.get("display_name", boss_name)
-        full_display = f"{emoji}{display_name}" if emoji else display_name
+    # Sort timers by spawn time; a heap avoids a full sort when truncating
+    if limit is not None:
+        sorted_timers = heapq.nsmallest(limit, deduped_timers.values(), key=itemgetter(0))
+    else:
+        sorted_timers = sorted(deduped_timers.values(), key=itemgetter(0))
 
-        # Parse and format spawn time
-        spawn_time = datetime.fromisoformat(spawn_time_str).replace(tzinfo=timezone)
+    lines = ["⏳ Boss计时器列表：\n"]
+    for spawn_time, boss_name in sorted_timers:
+        # Format spawn time in the primary timezone; cached spawn times are
+        # normally already in it (see get_spawn_time)
+        if spawn_time.tzinfo is not timezone:
+            spawn_time = spawn_time.astimezone(timezone)
         time_str = format_time(spawn_time, secondary_tz=secondary_tz, show_secondary=show_secondary)
-
-        lines.append(f"{full_display}：{time_str}")
+        lines.append(f"{get_boss_display_name(boss_name, bosses)}：{time_str}")
 
     return "\n".join(lines)
 
@@ -15,7 +15,8 @@ _LIB_MINI_DEATH_PATTERN = re.compile(
 
 def normalize_message(message: str) -> str:
     """Normalize spacing and case for Lib Mini command matching."""
-    return re.sub(r"\s+", " ", message.replace("　", " ")).strip().lower()
+    # str.split() treats full-width spaces as whitespace too
+    return " ".join(message.split()).lower()
 
 
 def is_lib_mini_death_report(message: str) -> bool:
@@ -5,16 +5,39 @@ Handles loading map data and alias mapping
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from astrbot.api import logger
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is the fallback
+    orjson = None
+
+_MAP_COMMAND_RE = re.compile(r"^/map(?:\s+(.+))?$", re.IGNORECASE)
+
+# (maps list, alias map built from it); holding the list keeps its id stable
+_map_alias_map_cache: Optional[Tuple[List[Dict], Dict[str, Dict]]] = None
+
+
+@lru_cache(maxsize=4)
+def _load_maps_file(path: str, mtime_ns: int) -> List[Dict]:
+    """Parse a maps.json file; mtime_ns is only part of the cache key"""
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data.get("maps", [])
+
 
 def load_maps(assets_dir: Path) -> List[Dict]:
     """
     Load map configuration from assets directory.
 
+    Parsed results are cached by path and modification time, so plugin
+    reloads only re-parse maps.json after it changes on disk. The returned
+    list is shared between callers and must not be mutated.
+
     Args:
         assets_dir: Assets directory containing maps.json
 
@@ -22,14 +45,14 @@ def load_maps(assets_dir: Path) -> List[Dict]:
         List of map configurations
     """
     maps_file = assets_dir / "maps.json"
-    if not maps_file.exists():
+    try:
+        mtime_ns = maps_file.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.warning(f"maps.json not found at {maps_file}")
         return []
 
     try:
-        with open(maps_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("maps", [])
+        return _load_maps_file(str(maps_file), mtime_ns)
     except Exception as e:
         logger.error(f"Failed to load maps.json: {e}")
         return []
@@ -39,12 +62,19 @@ def build_map_alias_map(maps: List[Dict]) -> Dict[str, Dict]:
     """
     Build alias to map mapping.
 
+    The result for the last maps list is memoized by identity, so callers
+    holding on to the same (unmodified) list reuse the map.
+
     Args:
         maps: List of map configurations
 
     Returns:
         Dictionary mapping lowercase alias/ID to map data
     """
+    global _map_alias_map_cache
+    if _map_alias_map_cache is not None and _map_alias_map_cache[0] is maps:
+        return _map_alias_map_cache[1]
+
     alias_map = {}
     for map_data in maps:
         map_id = map_data.get("id")
@@ -62,6 +92,7 @@ def build_map_alias_map(maps: List[Dict]) -> Dict[str, Dict]:
         for alias in map_data.get("aliases", []):
             alias_map[alias.lower()] = map_data
 
+    _map_alias_map_cache = (maps, alias_map)
     return alias_map
 
 
@@ -85,13 +116,48 @@ def parse_map_command(message: str) -> Optional[str]:
 
     Returns an empty string for "/map" so callers can show the map list.
     """
-    normalized = re.sub(r"\s+", " ", message.strip().replace("　", " "))
-    match = re.match(r"^/map(?:\s+(.+))?$", normalized, flags=re.IGNORECASE)
+    # str.split() treats full-width spaces as whitespace too
+    normalized = " ".join(message.split())
+    match = _MAP_COMMAND_RE.match(normalized)
     if not match:
         return None
     return (match.group(1) or "").strip()
 
 
+# Directories searched for map images, in priority order (relative to assets)
+MAP_IMAGE_DIRS = ("imo_maps_new", "", "IMO地图查看器_files")
+
+
+def resolve_map_files(maps: List[Dict], assets_dir: Path) -> Dict[str, str]:
+    """
+    Resolve every map image file to its path on disk, once.
+
+    The assets directory is read-only at runtime, so doing the existence checks
+    at startup keeps stat calls off the /map request path.
+
+    Args:
+        maps: List of map configurations
+        assets_dir: Assets directory
+
+    Returns:
+        Dictionary of map file name -> existing image path as a string, ready to
+        pass to the message API (missing files omitted)
+    """
+    result = {}
+    for map_data in maps:
+        map_file = map_data.get("file")
+        if not map_file or map_file in result:
+            continue
+        for sub_dir in MAP_IMAGE_DIRS:
+            map_path = assets_dir / sub_dir / map_file
+            if map_path.exists():
+                result[map_file] = str(map_path)
+                break
+        else:
+            logger.warning(f"Map file not found for {map_data.get('name')}: {map_file}")
+    return result
+
+
 def get_maps_by_category(maps: List[Dict]) -> Dict[str, List[Dict]]:
     """
     Group maps by category.
@@ -5,10 +5,33 @@ Supports isolated group sets (Set 1, Set 2, Set 3, ...)
 """
 
 import json
-from typing import Dict, List, Optional, Set
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from astrbot.api import logger
 
+# (raw group_boss_filters string, group ID -> allowed bosses), so the JSON is
+# parsed once per distinct config value instead of on every check
+_filters_cache: Optional[Tuple[str, Dict[str, FrozenSet[str]]]] = None
+
+# (whitelist_users snapshot, the same users as a frozenset of strings)
+_users_cache: Optional[Tuple[tuple, FrozenSet[str]]] = None
+
+_GROUP_LIST_KEY_PREFIXES = ("whitelist_groups", "core_groups")
+
+
+@dataclass(frozen=True)
+class _GroupIndex:
+    """Group lookups derived from the configured sets, as string group IDs."""
+
+    sets: Dict[int, Tuple[FrozenSet[str], FrozenSet[str]]]  # set -> (whitelist, core)
+    set_of_group: Dict[str, int]  # group ID -> lowest set number it appears in
+    core_groups: FrozenSet[str]  # core groups across all sets
+
+
+# (config group lists snapshot, index built from it)
+_group_index_cache: Optional[Tuple[tuple, _GroupIndex]] = None
+
 
 def _get_set_config_keys(set_num: int) -> tuple[str, str]:
     """Return whitelist/core config keys for a set number."""
@@ -36,6 +59,43 @@ def _get_configured_set_numbers(config: Dict) -> List[int]:
     return sorted(set_numbers)
 
 
+def _get_group_index(config: Dict) -> _GroupIndex:
+    """
+    Get the group lookups for the configured sets.
+
+    Cached against a snapshot of the config's group lists, so the str()
+    coercion and set building happen once per config change rather than on
+    every permission check.
+    """
+    global _group_index_cache
+    sources = tuple(
+        (key, tuple(value))
+        for key, value in config.items()
+        if value and key.startswith(_GROUP_LIST_KEY_PREFIXES)
+    )
+    if _group_index_cache is not None and _group_index_cache[0] == sources:
+        return _group_index_cache[1]
+
+    sets = {}
+    set_of_group = {}
+    for set_num in _get_configured_set_numbers(config):
+        whitelist_key, core_key = _get_set_config_keys(set_num)
+        whitelist = frozenset(str(g) for g in config.get(whitelist_key, []))
+        core = frozenset(str(g) for g in config.get(core_key, []))
+        sets[set_num] = (whitelist, core)
+        # Set numbers ascend, so a group listed in several sets keeps the lowest
+        for group_id in whitelist | core:
+            set_of_group.setdefault(group_id, set_num)
+
+    index = _GroupIndex(
+        sets=sets,
+        set_of_group=set_of_group,
+        core_groups=frozenset().union(*(core for _, core in sets.values())),
+    )
+    _group_index_cache = (sources, index)
+    return index
+
+
 def get_group_set(group_id: str, config: Dict) -> Optional[int]:
     """
     Determine which set a group belongs to.
@@ -47,16 +107,7 @@ def get_group_set(group_id: str, config: Dict) -> Optional[int]:
     Returns:
         Set number if group is in a configured set, None otherwise
     """
-    group_id_str = str(group_id)
-
-    for set_num in _get_configured_set_numbers(config):
-        whitelist_key, core_key = _get_set_config_keys(set_num)
-        whitelist = [str(g) for g in config.get(whitelist_key, [])]
-        core = [str(g) for g in config.get(core_key, [])]
-        if group_id_str in whitelist or group_id_str in core:
-            return set_num
-
-    return None
+    return _get_group_index(config).set_of_group.get(str(group_id))
 
 
 def get_all_groups_in_set(set_num: int, config: Dict) -> Set[str]:
@@ -70,14 +121,12 @@ def get_all_groups_in_set(set_num: int, config: Dict) -> Set[str]:
     Returns:
         Set of all group IDs in the specified set
     """
-    if set_num not in _get_configured_set_numbers(config):
+    group_sets = _get_group_index(config).sets.get(set_num)
+    if group_sets is None:
         return set()
 
-    whitelist_key, core_key = _get_set_config_keys(set_num)
-    whitelist = [str(g) for g in config.get(whitelist_key, [])]
-    core = [str(g) for g in config.get(core_key, [])]
-
-    return set(whitelist) | set(core)
+    whitelist, core = group_sets
+    return set(whitelist | core)
 
 
 def is_group_enabled(group_id: str, config: Dict) -> bool:
@@ -114,7 +163,12 @@ def is_user_enabled(user_id: str, config: Dict) -> bool:
     if not whitelist_users:
         logger.debug("Private chat disabled: whitelist_users is empty")
         return False
-    return str(user_id) in [str(u) for u in whitelist_users]
+
+    global _users_cache
+    users_key = tuple(whitelist_users)
+    if _users_cache is None or _users_cache[0] != users_key:
+        _users_cache = (users_key, frozenset(str(u) for u in whitelist_users))
+    return str(user_id) in _users_cache[1]
 
 
 async def can_reset_timers(event) -> bool:
@@ -157,18 +211,36 @@ def is_core_group(group_id: str, config: Dict) -> bool:
     Returns:
         True if this is a core group (in any configured set)
     """
-    group_id_str = str(group_id)
+    return str(group_id) in _get_group_index(config).core_groups
 
-    for set_num in _get_configured_set_numbers(config):
-        _, core_key = _get_set_config_keys(set_num)
-        core_groups = [str(g) for g in config.get(core_key, [])]
-        if group_id_str in core_groups:
-            return True
 
-    return False
+def _parse_group_boss_filters(filters_str: str) -> Dict[str, FrozenSet[str]]:
+    """
+    Parse group_boss_filters, caching the result for the last seen string.
+
+    Groups with an empty filter are left out (all bosses allowed). Invalid
+    JSON is logged once and treated as no filters.
+    """
+    global _filters_cache
+    if _filters_cache is not None and _filters_cache[0] == filters_str:
+        return _filters_cache[1]
+
+    try:
+        raw_filters = json.loads(filters_str)
+        filters = {
+            str(group_id): frozenset(bosses)
+            for group_id, bosses in raw_filters.items()
+            if bosses
+        }
+    except Exception as e:
+        logger.error(f"Failed to parse group_boss_filters: {e}")
+        filters = {}
+
+    _filters_cache = (filters_str, filters)
+    return filters
 
 
-def get_allowed_bosses_for_group(group_id: str, config: Dict) -> Optional[Set[str]]:
+def get_allowed_bosses_for_group(group_id: str, config: Dict) -> Optional[FrozenSet[str]]:
     """
     Get set of allowed boss names for this group.
 
@@ -177,27 +249,63 @@ def get_allowed_bosses_for_group(group_id: str, config: Dict) -> Optional[Set[st
         config: Plugin configuration
 
     Returns:
-        Set of allowed boss names, or None if no filtering (all bosses allowed)
+        Frozenset of allowed boss names, or None if no filtering (all bosses allowed)
     """
     filter_enabled = config.get("group_boss_filter_enabled", False)
     if not filter_enabled:
         return None  # No filtering, all bosses allowed
 
-    # Parse filters from JSON string
-    filters_str = config.get("group_boss_filters", "{}")
-    try:
-        filters = json.loads(filters_str)
-    except Exception as e:
-        logger.error(f"Failed to parse group_boss_filters: {e}")
-        return None
+    filters = _parse_group_boss_filters(config.get("group_boss_filters", "{}"))
+
+    # No filter for this group means all bosses allowed
+    return filters.get(str(group_id))
+
+
+def make_timer_filter(
+    viewer_group_id: Optional[str],
+    viewer_user_id: Optional[str],
+    config: Dict,
+) -> Callable[[str, Dict], bool]:
+    """
+    Build a timer visibility check for one viewer.
+    Enforces set isolation: groups can only see timers from their own set.
 
-    # Get filter for this group
-    group_filter = filters.get(str(group_id))
-    if not group_filter:
-        return None  # No filter for this group, all bosses allowed
+    The viewer's kind (private, normal group or core group) and set are
+    resolved once here and a check specialized for it is returned, so
+    checking many timers does no per-timer branching on the viewer.
+    Ownership comes from the timer's stored group_id/user_id (a falsy
+    group_id marks a private timer), which are strings as created by the
+    plugin and as normalized by load_timers, so they are compared as-is.
 
-    # Return as set for fast lookup
-    return set(group_filter)
+    Args:
+        viewer_group_id: Group ID of viewer (None for private chat)
+        viewer_user_id: User ID of viewer
+        config: Plugin configuration
+
+    Returns:
+        Function (timer_id, timer_data) -> True if the timer should be shown
+    """
+    # Private chat viewer: only show private timers for this user
+    if viewer_group_id is None:
+        viewer_user_id = str(viewer_user_id)
+        return lambda timer_id, timer_data: (
+            not timer_data.get("group_id") and timer_data.get("user_id") == viewer_user_id
+        )
+
+    # Group viewers never see private timers (even core groups): their
+    # group_id is None, which matches no group ID or set below. The viewer's
+    # IDs are stringified once here, never per timer.
+    index = _get_group_index(config)
+    own_group_id = str(viewer_group_id)
+
+    # Normal groups only see their own timers
+    if own_group_id not in index.core_groups:
+        return lambda timer_id, timer_data: timer_data.get("group_id") == own_group_id
+
+    # Core groups: set isolation, only show timers from the same set
+    set_of_group = index.set_of_group
+    viewer_set = set_of_group[own_group_id]
+    return lambda timer_id, timer_data: set_of_group.get(timer_data.get("group_id")) == viewer_set
 
 
 def should_show_timer(
@@ -211,6 +319,8 @@ def should_show_timer(
     Check if a timer should be visible to the viewer.
     Enforces set isolation: groups can only see timers from their own set.
 
+    To check many timers for the same viewer, use :func:`make_timer_filter`.
+
     Args:
         timer_id: Timer ID
         timer_data: Timer data dictionary
@@ -221,34 +331,4 @@ def should_show_timer(
     Returns:
         True if timer should be shown
     """
-    # Private chat viewer
-    if viewer_group_id is None:
-        # Only show private timers for this user
-        return timer_id.startswith(f"private_{viewer_user_id}_")
-
-    # Group viewer
-    # Never show private timers in groups (even core groups)
-    if timer_id.startswith("private_"):
-        return False
-
-    # Get timer's owner group from timer_data
-    timer_group_id = timer_data.get("group_id")
-    if not timer_group_id:
-        # Fallback: extract from timer_id (format: {group_id}_{boss})
-        parts = timer_id.split("_", 1)
-        timer_group_id = parts[0] if parts else None
-
-    # Determine which set the viewer and timer belong to
-    viewer_set = get_group_set(viewer_group_id, config)
-    timer_set = get_group_set(timer_group_id, config) if timer_group_id else None
-
-    # Set isolation: only show timers from the same set
-    if viewer_set != timer_set:
-        return False
-
-    # Core groups can see all timers within their set
-    if is_core_group(viewer_group_id, config):
-        return True
-
-    # Normal groups only see their own timers
-    return timer_id.startswith(f"{viewer_group_id}_")
+    return make_timer_filter(viewer_group_id, viewer_user_id, config)(timer_id, timer_data)
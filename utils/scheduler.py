@@ -4,41 +4,86 @@ Handles reminder scheduling and job management
 """
 
 import zoneinfo
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Callable, List
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 
 from astrbot.api import logger
 
+from .timer_storage import get_spawn_time
 
-def get_reminder_intervals(config: dict) -> List[int]:
+# (raw reminder_intervals string, parsed intervals)
+_intervals_cache: Optional[Tuple[str, Tuple[int, ...]]] = None
+
+
+def get_reminder_intervals(config: dict) -> Tuple[int, ...]:
     """
     Get reminder intervals from config.
 
+    The parsed value is cached for the last seen raw string, so reloads with
+    an unchanged setting skip the parse (and an invalid value warns once).
+
     Args:
         config: Plugin configuration
 
     Returns:
-        List of reminder intervals in minutes
+        Tuple of reminder intervals in minutes
     """
+    global _intervals_cache
     intervals_str = config.get("reminder_intervals", "3")
+    if _intervals_cache is not None and _intervals_cache[0] == intervals_str:
+        return _intervals_cache[1]
+
     try:
-        return [int(x.strip()) for x in intervals_str.split(",")]
+        # Drop repeats (keeping order) so each interval maps to one job ID
+        intervals = tuple(dict.fromkeys(int(x.strip()) for x in intervals_str.split(",")))
     except Exception as e:
         logger.warning(f"Invalid reminder_intervals: {e}, using default [3]")
-        return [3]
+        intervals = (3,)
+
+    _intervals_cache = (intervals_str, intervals)
+    return intervals
+
+
+@contextmanager
+def batched_jobs(scheduler: AsyncIOScheduler) -> Iterator[None]:
+    """
+    Add several jobs with a single scheduler wakeup.
+
+    A running scheduler re-processes its job stores after every add_job;
+    pausing defers that to the one wakeup done by resume(). Nested batches
+    and stopped/paused schedulers are passed through unchanged.
+
+    Only worth it for bulk adds such as restoring every timer: pause() and
+    resume() each log and dispatch a scheduler event, which costs more than
+    it saves around the one or two jobs of a single timer.
+    """
+    if scheduler.state != STATE_RUNNING:
+        yield
+        return
+
+    scheduler.pause()
+    try:
+        yield
+    finally:
+        scheduler.resume()
 
 
 def schedule_reminders(
     scheduler: AsyncIOScheduler,
     timer_id: str,
-    boss_name: str,
+    display_name: str,
     spawn_time: datetime,
     umo: str,
     reminder_callback: Callable,
-    intervals: List[int],
+    intervals: Sequence[int],
     timezone: zoneinfo.ZoneInfo,
+    now: Optional[datetime] = None,
+    job_index: Optional[Dict[str, List[str]]] = None,
 ) -> int:
     """
     Schedule reminder jobs for a boss timer.
@@ -46,17 +91,23 @@ def schedule_reminders(
     Args:
         scheduler: APScheduler instance
         timer_id: Unique timer ID
-        boss_name: Boss key/name
+        display_name: Boss display name (with emoji), passed to the callback
         spawn_time: When the boss will spawn
         umo: Unified message origin (group/user ID)
         reminder_callback: Async function to call for reminders
         intervals: List of reminder intervals in minutes
         timezone: Timezone for scheduling
+        now: Current time, to share one clock read across a batch of calls
+        job_index: Optional timer_id -> job IDs index to record scheduled jobs in.
+            Callers passing it cancel the timer's indexed jobs before
+            rescheduling, so its job IDs are known to be free and the
+            scheduler's replace-existing handling is skipped.
 
     Returns:
         Number of reminders successfully scheduled
     """
-    now = datetime.now(timezone)
+    if now is None:
+        now = datetime.now(timezone)
     scheduled_count = 0
 
     for minutes in intervals:
@@ -64,7 +115,7 @@ def schedule_reminders(
 
         # Skip if remind time has passed
         if remind_time <= now:
-            logger.debug(f"Skipping past reminder for {boss_name} at {remind_time}")
+            logger.debug(f"Skipping past reminder for {display_name} at {remind_time}")
             continue
 
         # Schedule the reminder
@@ -74,39 +125,45 @@ def schedule_reminders(
                 reminder_callback,
                 "date",
                 run_date=remind_time,
-                args=[boss_name, spawn_time, umo, minutes],
+                args=[display_name, spawn_time, umo, minutes],
                 id=job_id,
-                replace_existing=True,
+                replace_existing=job_index is None,
             )
             scheduled_count += 1
-            logger.debug(f"Scheduled {boss_name} {minutes}min reminder at {remind_time}")
+            if job_index is not None:
+                job_index.setdefault(timer_id, []).append(job_id)
+            logger.debug(f"Scheduled {display_name} {minutes}min reminder at {remind_time}")
         except Exception as e:
             logger.error(f"Failed to schedule reminder {job_id}: {e}")
 
     return scheduled_count
 
 
-def cancel_reminder_jobs(scheduler: AsyncIOScheduler, timer_id: str) -> int:
+def cancel_reminder_jobs(
+    scheduler: AsyncIOScheduler,
+    timer_id: str,
+    job_index: Dict[str, List[str]],
+) -> int:
     """
     Cancel all reminder jobs for a timer.
 
     Args:
         scheduler: APScheduler instance
         timer_id: Timer ID
+        job_index: Index filled by schedule_reminders; only the timer's own
+            jobs are touched instead of scanning every job
 
     Returns:
         Number of jobs cancelled
     """
     cancelled_count = 0
-    # Get all jobs that match this timer
-    for job in scheduler.get_jobs():
-        if job.id.startswith(f"{timer_id}_remind_"):
-            try:
-                job.remove()
-                cancelled_count += 1
-                logger.debug(f"Cancelled job {job.id}")
-            except Exception as e:
-                logger.error(f"Failed to cancel job {job.id}: {e}")
+    for job_id in job_index.pop(timer_id, ()):
+        try:
+            scheduler.remove_job(job_id)
+            cancelled_count += 1
+            logger.debug(f"Cancelled job {job_id}")
+        except JobLookupError:
+            pass  # Reminder already fired (date jobs remove themselves)
 
     return cancelled_count
 
@@ -114,6 +171,7 @@ def cancel_reminder_jobs(scheduler: AsyncIOScheduler, timer_id: str) -> int:
 def cleanup_expired_timers(
     timers: dict,
     timezone: zoneinfo.ZoneInfo,
+    now: Optional[datetime] = None,
 ) -> int:
     """
     Remove expired timers from dictionary.
@@ -121,21 +179,22 @@ def cleanup_expired_timers(
     Args:
         timers: Timers dictionary
         timezone: Timezone for comparison
+        now: Current time (defaults to datetime.now(timezone))
 
     Returns:
         Number of timers removed
     """
-    now = datetime.now(timezone)
+    if now is None:
+        now = datetime.now(timezone)
     to_remove = []
 
     for timer_id, timer_data in timers.items():
-        spawn_time_str = timer_data.get("spawn_time")
-        if not spawn_time_str:
+        if not timer_data.get("spawn_time"):
             to_remove.append(timer_id)
             continue
 
         try:
-            spawn_time = datetime.fromisoformat(spawn_time_str).replace(tzinfo=timezone)
+            spawn_time = get_spawn_time(timer_data, timezone)
             if spawn_time < now:
                 to_remove.append(timer_id)
         except Exception as e:
@@ -1,40 +1,265 @@
 """
 Timer storage management for TWOM Boss Timer
 Handles loading, saving, and managing timer data
+
+Timers are persisted as a timers.json snapshot plus an append-only
+timers.journal (one JSON change per line). Individual timer changes are
+appended to the journal, which is folded back into the snapshot on load
+and whenever it grows large relative to the snapshot.
 """
 
 import json
+import os
+import zoneinfo
+from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Iterable
 
 from astrbot.api import logger
 
+from .time_utils import parse_iso_time
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is the fallback
+    orjson = None
+
+TIMERS_FILE = "timers.json"
+JOURNAL_FILE = "timers.journal"
+
+# Compact once the journal is larger than this many times the snapshot, but
+# never for journals below the floor (an empty snapshot is only a few bytes).
+_JOURNAL_COMPACT_RATIO = 2
+_JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+
+# Keys cached on timer dicts in memory only, never written to disk
+_IN_MEMORY_KEYS = ("_spawn_dt",)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
-def load_timers(data_dir: Path) -> Dict:
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _serializable(timer_data: Dict) -> Dict:
+    """Strip in-memory keys from a timer before writing"""
+    # A C-level dict copy plus pops is ~10x faster than a filtering comprehension
+    data = timer_data.copy()
+    for key in _IN_MEMORY_KEYS:
+        data.pop(key, None)
+    return data
+
+
+def _normalize_owner(timer_id: str, timer_data: Dict) -> None:
     """
-    Load timers from JSON file.
+    Make sure a timer's group_id/user_id are set, as strings or None.
+
+    Timers saved before the owner was stored only carry it in the ID
+    ({group_id}_{boss} or private_{user_id}_{boss}). After this, permission
+    checks neither parse the ID nor str() the owner per timer.
+    """
+    if "group_id" not in timer_data:
+        if timer_id.startswith("private_"):
+            timer_data["group_id"] = None
+            timer_data.setdefault("user_id", timer_id.split("_", 2)[1])
+        else:
+            timer_data["group_id"] = timer_id.split("_", 1)[0]
+            timer_data.setdefault("user_id", None)
+
+    for key in ("group_id", "user_id"):
+        value = timer_data.get(key)
+        if value is not None and not isinstance(value, str):
+            timer_data[key] = str(value)
+
+
+def _replay_journal(journal_file: Path, timers: Dict) -> int:
+    """
+    Apply journal entries to timers in place.
+
+    Args:
+        journal_file: Path to timers.journal
+        timers: Timers loaded from the snapshot
+
+    Returns:
+        Number of entries applied
+    """
+    applied = 0
+    with open(journal_file, "rb") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = _loads(line)
+                if entry["op"] == "set":
+                    timers[entry["id"]] = entry["data"]
+                elif entry["op"] == "del":
+                    timers.pop(entry["id"], None)
+                else:
+                    raise ValueError(f"unknown op {entry['op']!r}")
+            except Exception as e:
+                # A torn last line from a crash mid-append is expected; skip it
+                logger.warning(f"Skipping bad timers.journal line {line_no}: {e}")
+                continue
+            applied += 1
+    return applied
+
+
+def load_timers(data_dir: Path, timezone: zoneinfo.ZoneInfo) -> Dict:
+    """
+    Load timers from the JSON snapshot and replay the journal.
+
+    Malformed entries are dropped here, once, and every kept timer has its
+    spawn time parsed and cached (see :func:`get_spawn_time`) and its owning
+    group_id/user_id set as strings, so callers can trust the loaded data
+    without per-timer error handling or owner normalization. A non-empty
+    journal is compacted into the snapshot before returning.
 
     Args:
         data_dir: Directory containing timers.json
+        timezone: Timezone to assume for timestamps stored without an offset
 
     Returns:
         Dictionary of timers
     """
-    timers_file = data_dir / "timers.json"
-    if timers_file.exists():
+    timers_file = data_dir / TIMERS_FILE
+    journal_file = data_dir / JOURNAL_FILE
+
+    # Missing files are the normal first-run / just-compacted case; opening
+    # directly saves an exists() stat per file
+    raw_timers = {}
+    try:
+        raw_timers = _loads(timers_file.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Failed to load timers.json: {e}")
+        return {}
+
+    replayed = 0
+    try:
+        replayed = _replay_journal(journal_file, raw_timers)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Failed to read timers.journal: {e}")
+
+    timers = {}
+    for timer_id, timer_data in raw_timers.items():
         try:
-            with open(timers_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            get_spawn_time(timer_data, timezone)
         except Exception as e:
-            logger.error(f"Failed to load timers.json: {e}")
-    return {}
+            logger.warning(f"Dropping malformed timer {timer_id}: {e}")
+            continue
+        _normalize_owner(timer_id, timer_data)
+        timers[timer_id] = timer_data
+
+    if replayed:
+        save_timers(data_dir, timers)
+    return timers
 
 
 def save_timers(data_dir: Path, timers: Dict) -> None:
-    """Save timers to JSON file"""
-    timers_file = data_dir / "timers.json"
+    """
+    Write a full timers.json snapshot and discard the journal.
+
+    The snapshot is written to a temp file, fsynced, and swapped in with
+    os.replace, so neither a crash mid-write nor a power loss right after
+    the swap leaves a truncated timers.json behind.
+    """
+    timers_file = data_dir / TIMERS_FILE
+    tmp_file = timers_file.with_name(TIMERS_FILE + ".tmp")
+    serializable = {
+        timer_id: _serializable(timer_data) for timer_id, timer_data in timers.items()
+    }
     try:
-        with open(timers_file, "w", encoding="utf-8") as f:
-            json.dump(timers, f, ensure_ascii=False, indent=2)
+        with open(tmp_file, "wb") as f:
+            f.write(_dumps(serializable))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, timers_file)
     except Exception as e:
         logger.error(f"Failed to save timers.json: {e}")
+        return
+
+    # The snapshot now contains every journaled change
+    (data_dir / JOURNAL_FILE).unlink(missing_ok=True)
+
+
+def append_timer_changes(data_dir: Path, timers: Dict, timer_ids: Iterable[str]) -> None:
+    """
+    Append changed timers to the journal (O(changes) instead of a full rewrite).
+
+    Timer IDs present in ``timers`` are journaled as their current data, the
+    rest as deletions. Compacts into a full snapshot once the journal grows
+    too large.
+
+    Args:
+        data_dir: Directory containing timers.json
+        timers: Current timers dictionary
+        timer_ids: IDs of timers added, updated, or removed since the last save
+    """
+    lines = []
+    for timer_id in timer_ids:
+        timer_data = timers.get(timer_id)
+        if timer_data is None:
+            entry = {"op": "del", "id": timer_id}
+        else:
+            entry = {"op": "set", "id": timer_id, "data": _serializable(timer_data)}
+        lines.append(_dumps(entry) + b"\n")
+    if not lines:
+        return
+
+    journal_file = data_dir / JOURNAL_FILE
+    try:
+        with open(journal_file, "ab") as f:
+            f.writelines(lines)
+        journal_size = journal_file.stat().st_size
+        try:
+            snapshot_size = (data_dir / TIMERS_FILE).stat().st_size
+        except FileNotFoundError:
+            snapshot_size = 0  # No snapshot written yet
+    except Exception as e:
+        logger.error(f"Failed to append to timers.journal: {e}")
+        save_timers(data_dir, timers)
+        return
+
+    if journal_size > max(_JOURNAL_COMPACT_MIN_BYTES, _JOURNAL_COMPACT_RATIO * snapshot_size):
+        save_timers(data_dir, timers)
+
+
+def get_spawn_time(timer_data: Dict, timezone: zoneinfo.ZoneInfo) -> datetime:
+    """
+    Get a timer's spawn time as an aware datetime.
+
+    The parsed value is cached on the timer under "_spawn_dt" so repeated
+    list/restore passes don't re-parse the stored ISO string. It is cached
+    already converted to ``timezone``, so display code rendering in that
+    zone never converts it again.
+
+    Args:
+        timer_data: Timer data dictionary
+        timezone: Plugin timezone (also assumed for timestamps stored
+            without an offset)
+
+    Returns:
+        Spawn time in ``timezone``
+
+    Raises:
+        KeyError: If the timer has no spawn_time
+        ValueError: If spawn_time is not a valid ISO timestamp
+    """
+    spawn_time = timer_data.get("_spawn_dt")
+    if spawn_time is None:
+        spawn_time = parse_iso_time(timer_data["spawn_time"], timezone).astimezone(timezone)
+        timer_data["_spawn_dt"] = spawn_time
+    return spawn_time